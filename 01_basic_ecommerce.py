@@ -11,7 +11,6 @@ Now includes robust error handling, geographic awareness, and fallback sites.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
 from nova_act import NovaAct
 
@@ -119,7 +118,7 @@ class BasicEcommerceDemo(BaseDemo):
             nova.act(f"search for {search_term}")
             
             # Wait a moment for results to load
-            time.sleep(2)
+            self.wait_for_page(nova, 2)
             
             self.logger.log_step(1, "Product Search", "completed", f"Searched for {search_term}")
             return {"search_term": search_term, "search_completed": True}
@@ -137,7 +136,7 @@ class BasicEcommerceDemo(BaseDemo):
             nova.act("click on the first product in the search results")
             
             # Wait for product page to load
-            time.sleep(3)
+            self.wait_for_page(nova, 3)
             
             self.logger.log_step(2, "Product Selection", "completed")
             return {"product_selected": True}
@@ -200,7 +199,7 @@ class BasicEcommerceDemo(BaseDemo):
             nova.act("scroll down or up until you see 'add to cart' button and then click it")
             
             # Wait for cart action to complete
-            time.sleep(2)
+            self.wait_for_page(nova, 2, min_wait=1)
             
             # Check if we were successful (in a real implementation)
             cart_result = {"added_to_cart": True, "method": "primary"}
@@ -230,7 +229,7 @@ class BasicEcommerceDemo(BaseDemo):
             nova.act("click on the shopping cart icon to view the cart")
             
             # Wait for cart page to load
-            time.sleep(2)
+            self.wait_for_page(nova, 2)
             
             cart_data = {"cart_viewed": True}
             
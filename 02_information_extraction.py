@@ -9,6 +9,7 @@ using Pydantic schemas with robust error handling and geographic awareness.
 
 import os
 import sys
+from contextlib import ExitStack
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from nova_act import NovaAct, BOOL_SCHEMA
@@ -44,6 +45,19 @@ class ProductInfo(BaseModel):
     description: Optional[str] = None
 
 
+# Extraction schemas are built once at import and shared by every site attempt
+BOOK_LIST_SCHEMA = BookList.model_json_schema()
+NEWS_COLLECTION_SCHEMA = NewsCollection.model_json_schema()
+PRODUCT_INFO_SCHEMA = ProductInfo.model_json_schema()
+
+# Site-specific news prompts, keyed by a substring of the site URL
+NEWS_EXTRACTION_PROMPTS = {
+    "ycombinator": "Extract the top 5 news articles with their headlines and any available summary",
+    "bbc": "Extract the main news headlines and their brief descriptions",
+}
+DEFAULT_NEWS_EXTRACTION_PROMPT = "Extract news headlines and summaries from the main page"
+
+
 class InformationExtractionDemo(BaseDemo):
     """Enhanced information extraction demo with error handling and fallbacks."""
     
@@ -124,14 +138,15 @@ class InformationExtractionDemo(BaseDemo):
                 self.logger.info("Extracting book information...")
                 result = nova.act(
                     "Extract information about the first 5 books shown including title, author, and price",
-                    schema=BookList.model_json_schema()
+                    schema=BOOK_LIST_SCHEMA
                 )
                 
                 if result.matches_schema:
                     book_list = BookList.model_validate(result.parsed_response)
                     self.logger.log_step(1, "Book Extraction", "completed", f"Extracted {len(book_list.books)} books")
-                    self.logger.log_data_extraction("books", book_list.dict(), "books.toscrape.com")
-                    return {"books": book_list.dict(), "book_count": len(book_list.books)}
+                    books_data = book_list.model_dump()
+                    self.logger.log_data_extraction("books", books_data, "books.toscrape.com")
+                    return {"books": books_data, "book_count": len(book_list.books)}
                 else:
                     self.logger.log_step(1, "Book Extraction", "failed", "Schema validation failed")
                     return {"books": None, "book_extraction_error": result.response}
@@ -148,43 +163,65 @@ class InformationExtractionDemo(BaseDemo):
         # Get region-appropriate news sites
         news_sites = self.config_manager.get_optimal_sites("news")
         
-        for site in news_sites:
-            try:
-                self.logger.info(f"Trying news site: {site}")
-                
-                with NovaAct(
-                    starting_page=site,
-                    logs_directory="./demo/logs/news_extraction"
-                ) as nova:
-                    
-                    # Different extraction strategies for different sites
-                    if "ycombinator" in site:
-                        extraction_prompt = "Extract the top 5 news articles with their headlines and any available summary"
-                    elif "bbc" in site:
-                        extraction_prompt = "Extract the main news headlines and their brief descriptions"
-                    else:
-                        extraction_prompt = "Extract news headlines and summaries from the main page"
-                    
-                    result = nova.act(extraction_prompt, schema=NewsCollection.model_json_schema())
-                    
-                    if result.matches_schema:
-                        news_collection = NewsCollection.model_validate(result.parsed_response)
-                        self.logger.log_step(2, "News Extraction", "completed", f"Extracted {len(news_collection.articles)} articles from {site}")
-                        self.logger.log_data_extraction("news", news_collection.dict(), site)
-                        return {"news": news_collection.dict(), "news_source": site, "article_count": len(news_collection.articles)}
-                    else:
-                        self.logger.warning(f"Schema validation failed for {site}")
-                        continue
-                        
-            except Exception as e:
-                self.logger.warning(f"Failed to extract from {site}: {str(e)}")
-                continue
+        news = self._extract_from_sites(news_sites, "./demo/logs/news_extraction", self._extract_news_from_site)
+        if news:
+            return news
         
         # If all sites failed
         self.logger.log_step(2, "News Extraction", "failed", "All news sites failed")
         self.add_warning("News extraction failed - all sites may be restricted in your region")
         return {"news": None, "news_extraction_error": "All sites failed"}
     
+    def _extract_news_from_site(self, nova, site: str) -> Optional[Dict[str, Any]]:
+        """Extract news articles from the site currently loaded in nova."""
+        self.logger.info(f"Trying news site: {site}")
+        
+        # Different extraction strategies for different sites
+        extraction_prompt = next(
+            (prompt for key, prompt in NEWS_EXTRACTION_PROMPTS.items() if key in site),
+            DEFAULT_NEWS_EXTRACTION_PROMPT
+        )
+        
+        result = nova.act(extraction_prompt, schema=NEWS_COLLECTION_SCHEMA)
+        
+        if not result.matches_schema:
+            self.logger.warning(f"Schema validation failed for {site}")
+            return None
+        
+        news_collection = NewsCollection.model_validate(result.parsed_response)
+        self.logger.log_step(2, "News Extraction", "completed", f"Extracted {len(news_collection.articles)} articles from {site}")
+        news_data = news_collection.model_dump()
+        self.logger.log_data_extraction("news", news_data, site)
+        return {"news": news_data, "news_source": site, "article_count": len(news_collection.articles)}
+    
+    def _extract_from_sites(self, sites: List[str], logs_directory: str, extract_site) -> Optional[Dict[str, Any]]:
+        """
+        Run extract_site(nova, site) on each candidate site until one returns a result.
+        
+        The sites share one browser, launched on the first site and reused
+        for the rest via go_to_url instead of starting a fresh one per site.
+        A site that fails, including failing to launch the browser, is
+        skipped and the next one tried.
+        """
+        with ExitStack() as stack:
+            nova = None
+            for site in sites:
+                try:
+                    if nova is None:
+                        nova = stack.enter_context(NovaAct(starting_page=site, logs_directory=logs_directory))
+                    else:
+                        nova.go_to_url(site)
+                    
+                    extracted = extract_site(nova, site)
+                    if extracted:
+                        return extracted
+                        
+                except Exception as e:
+                    self.logger.warning(f"Failed to extract from {site}: {str(e)}")
+                    continue
+        
+        return None
+    
     def _step_extract_product(self) -> Dict[str, Any]:
         """Step 3: Extract product information."""
         self.logger.log_step(3, "Product Extraction", "starting")
@@ -192,46 +229,42 @@ class InformationExtractionDemo(BaseDemo):
         # Get region-appropriate e-commerce sites
         ecommerce_sites = self.config_manager.get_optimal_sites("ecommerce")
         
-        for site in ecommerce_sites:
-            try:
-                self.logger.info(f"Trying e-commerce site: {site}")
-                
-                with NovaAct(
-                    starting_page=site,
-                    logs_directory="./demo/logs/product_extraction"
-                ) as nova:
-                    
-                    # Search for a product
-                    search_term = "laptop"
-                    nova.act(f"search for {search_term}")
-                    
-                    # Select first result
-                    nova.act("click on the first product result")
-                    
-                    # Extract product information
-                    result = nova.act(
-                        "Extract the product name, price, rating, availability status, and a brief description",
-                        schema=ProductInfo.model_json_schema()
-                    )
-                    
-                    if result.matches_schema:
-                        product = ProductInfo.model_validate(result.parsed_response)
-                        self.logger.log_step(3, "Product Extraction", "completed", f"Extracted product from {site}")
-                        self.logger.log_data_extraction("product", product.dict(), site)
-                        return {"product": product.dict(), "product_source": site}
-                    else:
-                        self.logger.warning(f"Product schema validation failed for {site}")
-                        continue
-                        
-            except Exception as e:
-                self.logger.warning(f"Failed to extract product from {site}: {str(e)}")
-                continue
+        product = self._extract_from_sites(ecommerce_sites, "./demo/logs/product_extraction", self._extract_product_from_site)
+        if product:
+            return product
         
         # If all sites failed
         self.logger.log_step(3, "Product Extraction", "failed", "All e-commerce sites failed")
         self.add_warning("Product extraction failed - sites may be restricted or unavailable")
         return {"product": None, "product_extraction_error": "All sites failed"}
     
+    def _extract_product_from_site(self, nova, site: str) -> Optional[Dict[str, Any]]:
+        """Search for a product on the site currently loaded in nova and extract its details."""
+        self.logger.info(f"Trying e-commerce site: {site}")
+        
+        # Search for a product
+        search_term = "laptop"
+        nova.act(f"search for {search_term}")
+        
+        # Select first result
+        nova.act("click on the first product result")
+        
+        # Extract product information
+        result = nova.act(
+            "Extract the product name, price, rating, availability status, and a brief description",
+            schema=PRODUCT_INFO_SCHEMA
+        )
+        
+        if not result.matches_schema:
+            self.logger.warning(f"Product schema validation failed for {site}")
+            return None
+        
+        product = ProductInfo.model_validate(result.parsed_response)
+        self.logger.log_step(3, "Product Extraction", "completed", f"Extracted product from {site}")
+        product_data = product.model_dump()
+        self.logger.log_data_extraction("product", product_data, site)
+        return {"product": product_data, "product_source": site}
+    
     def _step_boolean_extraction(self) -> Dict[str, Any]:
         """Step 4: Boolean extraction demo."""
         self.logger.log_step(4, "Boolean Extraction", "starting")
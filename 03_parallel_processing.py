@@ -11,6 +11,7 @@ import os
 import sys
 import time
 from typing import Dict, Any, List
+from urllib.parse import urlsplit, urlunsplit
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from nova_act import NovaAct, ActError
 from pydantic import BaseModel
@@ -27,6 +28,13 @@ class ProductInfo(BaseModel):
     rating: str = "N/A"
 
 
+def _canonical_site(url: str) -> str:
+    """Reduce a site URL to a key that ignores case, "www.", query and fragment."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    return urlunsplit((parts.scheme.lower() or "https", host, parts.path.rstrip("/"), "", ""))
+
+
 class ParallelProcessingDemo(BaseDemo):
     """Enhanced parallel processing demo with error handling and site validation."""
     
@@ -87,8 +95,19 @@ class ParallelProcessingDemo(BaseDemo):
         # Get region-appropriate e-commerce sites
         ecommerce_sites = self.config_manager.get_optimal_sites("ecommerce")
         
-        # Limit to 3 sites for parallel demo
-        selected_sites = ecommerce_sites[:3]
+        # Limit to 3 distinct sites for parallel demo; a repeated site (even
+        # one spelled differently, e.g. with "www." or a tracking query) would
+        # just launch a second browser against the same page
+        selected_sites = []
+        seen_sites = set()
+        for site in ecommerce_sites:
+            site_key = _canonical_site(site)
+            if site_key in seen_sites:
+                continue
+            seen_sites.add(site_key)
+            selected_sites.append(site)
+            if len(selected_sites) == 3:
+                break
         
         self.logger.log_step(1, "Site Selection", "completed", f"Selected {len(selected_sites)} sites")
         self.logger.log_data_extraction("selected_sites", {"sites": selected_sites}, "config_manager")
@@ -102,8 +121,12 @@ class ParallelProcessingDemo(BaseDemo):
         accessible_sites = []
         validation_results = {}
         
-        for site in sites:
-            is_accessible = self.config_manager.validate_site_access(site)
+        # Probe all sites concurrently; each check is a blocking HEAD request,
+        # so the step now takes as long as the slowest site rather than the sum
+        with ThreadPoolExecutor(max_workers=max(len(sites), 1)) as executor:
+            access_checks = list(executor.map(self.config_manager.validate_site_access, sites))
+        
+        for site, is_accessible in zip(sites, access_checks):
             validation_results[site] = is_accessible
             
             if is_accessible:
@@ -131,14 +154,20 @@ class ParallelProcessingDemo(BaseDemo):
         
         search_term = "laptop"
         results = []
+        # Every result from this run is stamped with the same batch time so
+        # they group together downstream
+        batch_timestamp = time.time()
         
-        # Use ThreadPoolExecutor for parallel execution
-        max_workers = min(len(sites), 3)  # Limit concurrent sessions
+        # Use ThreadPoolExecutor for parallel execution. Workers spend their time
+        # waiting on the browser, so size the pool from the work available and
+        # the host's cores rather than a fixed cap; config can still pin it
+        max_workers = self.config.get("max_workers") or min(len(sites), (os.cpu_count() or 1) + 2)
+        max_workers = max(1, max_workers)
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             # Submit search tasks
             future_to_site = {
-                executor.submit(self._search_single_site, site, search_term): site 
+                executor.submit(self._search_single_site, site, search_term, batch_timestamp): site 
                 for site in sites
             }
             
@@ -163,7 +192,7 @@ class ParallelProcessingDemo(BaseDemo):
         
         return {"results": results, "search_term": search_term}
     
-    def _search_single_site(self, site: str, search_term: str) -> Dict[str, Any]:
+    def _search_single_site(self, site: str, search_term: str, batch_timestamp: float) -> Dict[str, Any]:
         """Search for a product on a single site."""
         try:
             with NovaAct(
@@ -185,7 +214,7 @@ class ParallelProcessingDemo(BaseDemo):
                         "source": site,
                         "search_term": search_term,
                         "found_product": True,
-                        "timestamp": time.time()
+                        "timestamp": batch_timestamp
                     }
                     
                     # Try to get product name and price (simplified)
@@ -205,7 +234,7 @@ class ParallelProcessingDemo(BaseDemo):
                         "search_term": search_term,
                         "found_product": False,
                         "error": str(e),
-                        "timestamp": time.time()
+                        "timestamp": batch_timestamp
                     }
                     
         except Exception as e:
@@ -220,17 +249,22 @@ class ParallelProcessingDemo(BaseDemo):
             self.logger.log_step(4, "Results Aggregation", "completed", "No results to aggregate")
             return {"aggregated_results": {"total_sites": 0, "successful_searches": 0}}
         
-        # Aggregate statistics
+        # Aggregate statistics in a single pass over the results
         total_sites = len(results)
-        successful_searches = len([r for r in results if r and r.get("found_product", False)])
-        failed_searches = total_sites - successful_searches
-        
-        # Group by source
         by_source = {}
+        sites_with_results = []
+        sites_with_errors = []
         for result in results:
-            if result:
-                source = result.get("source", "unknown")
-                by_source[source] = result
+            if not result:
+                continue
+            by_source[result.get("source", "unknown")] = result
+            if result.get("found_product"):
+                sites_with_results.append(result["source"])
+            else:
+                sites_with_errors.append(result["source"])
+        
+        successful_searches = len(sites_with_results)
+        failed_searches = total_sites - successful_searches
         
         aggregated = {
             "total_sites_searched": total_sites,
@@ -239,8 +273,8 @@ class ParallelProcessingDemo(BaseDemo):
             "success_rate": (successful_searches / total_sites * 100) if total_sites > 0 else 0,
             "results_by_source": by_source,
             "search_summary": {
-                "sites_with_results": [r["source"] for r in results if r and r.get("found_product")],
-                "sites_with_errors": [r["source"] for r in results if r and not r.get("found_product")]
+                "sites_with_results": sites_with_results,
+                "sites_with_errors": sites_with_errors
             }
         }
         
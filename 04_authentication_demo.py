@@ -58,23 +58,44 @@ class AuthenticationDemo(BaseDemo):
             extracted_data.update(site_info)
             self.increment_step("Site selection completed")
             
-            # Step 2: Check existing session
-            session_status = self._step_check_session(site_info["target_site"])
-            extracted_data.update(session_status)
-            self.increment_step("Session check completed")
+            # Steps 2-4 share one browser on the session profile; step 5 opens
+            # its own afterwards, since it tests that the session survives a
+            # fresh launch
+            try:
+                with NovaAct(
+                    starting_page=site_info["target_site"]["url"],
+                    user_data_dir=self.user_data_dir,
+                    clone_user_data_dir=False,  # Don't clone to preserve session
+                    logs_directory="./demo/logs/auth_session"
+                ) as nova:
+                    
+                    # Step 2: Check existing session
+                    session_status = self._step_check_session(nova, site_info["target_site"])
+                    extracted_data.update(session_status)
+                    self.increment_step("Session check completed")
+                    
+                    # Step 3: Handle authentication if needed
+                    auth_result = self._step_handle_authentication(
+                        nova,
+                        site_info["target_site"], 
+                        session_status["already_authenticated"]
+                    )
+                    extracted_data.update(auth_result)
+                    self.increment_step("Authentication handling completed")
+                    
+                    # Step 4: Verify authentication status
+                    verification = self._step_verify_authentication(nova, site_info["target_site"])
+                    extracted_data.update(verification)
+                    self.increment_step("Authentication verification completed")
             
-            # Step 3: Handle authentication if needed
-            auth_result = self._step_handle_authentication(
-                site_info["target_site"], 
-                session_status["already_authenticated"]
-            )
-            extracted_data.update(auth_result)
-            self.increment_step("Authentication handling completed")
-            
-            # Step 4: Verify authentication status
-            verification = self._step_verify_authentication(site_info["target_site"])
-            extracted_data.update(verification)
-            self.increment_step("Authentication verification completed")
+            except Exception as e:
+                # Record the failure like the steps themselves do; step 5 opens
+                # its own browser, so it still runs
+                self.logger.warning(f"Failed to start authentication session: {str(e)}")
+                extracted_data.setdefault("already_authenticated", False)
+                extracted_data.setdefault("session_check_error", str(e))
+                extracted_data.setdefault("authentication_result", {"status": "failed", "error": str(e)})
+                extracted_data.setdefault("verification", {"site_accessible": False, "error": str(e)})
             
             # Step 5: Test session persistence
             persistence_test = self._step_test_persistence(site_info["target_site"])
@@ -128,42 +149,35 @@ class AuthenticationDemo(BaseDemo):
         
         return {"target_site": target_site}
     
-    def _step_check_session(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_check_session(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Check if we have an existing authenticated session."""
         self.logger.log_step(2, "Session Check", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                user_data_dir=self.user_data_dir,
-                clone_user_data_dir=False,  # Don't clone to preserve session
-                logs_directory="./demo/logs/auth_session_check"
-            ) as nova:
-                
-                # Check if we're already authenticated
-                # This is site-specific logic - adapt based on your target site
-                if "httpbin" in site_info["url"]:
-                    # For HTTPBin, we'll check if we can access the form
-                    already_authenticated = False  # HTTPBin doesn't have persistent auth
-                elif "example" in site_info["url"]:
-                    # Example.com is static, no authentication needed
-                    already_authenticated = True
-                else:
-                    # Generic check - look for login indicators
-                    result = nova.act("Is there a login or sign in button visible?", schema=BOOL_SCHEMA)
-                    already_authenticated = not (result.matches_schema and result.parsed_response)
-                
-                session_data = {
-                    "already_authenticated": already_authenticated,
-                    "session_dir": self.user_data_dir,
-                    "site_type": site_info.get("type", "unknown")
-                }
-                
-                self.logger.log_step(2, "Session Check", "completed", 
-                                   f"Authenticated: {already_authenticated}")
-                
-                return session_data
-                
+            # Check if we're already authenticated
+            # This is site-specific logic - adapt based on your target site
+            if "httpbin" in site_info["url"]:
+                # For HTTPBin, we'll check if we can access the form
+                already_authenticated = False  # HTTPBin doesn't have persistent auth
+            elif "example" in site_info["url"]:
+                # Example.com is static, no authentication needed
+                already_authenticated = True
+            else:
+                # Generic check - look for login indicators
+                result = nova.act("Is there a login or sign in button visible?", schema=BOOL_SCHEMA)
+                already_authenticated = not (result.matches_schema and result.parsed_response)
+            
+            session_data = {
+                "already_authenticated": already_authenticated,
+                "session_dir": self.user_data_dir,
+                "site_type": site_info.get("type", "unknown")
+            }
+            
+            self.logger.log_step(2, "Session Check", "completed", 
+                               f"Authenticated: {already_authenticated}")
+            
+            return session_data
+            
         except Exception as e:
             self.logger.log_step(2, "Session Check", "failed", str(e))
             return {
@@ -172,7 +186,7 @@ class AuthenticationDemo(BaseDemo):
                 "session_dir": self.user_data_dir
             }
     
-    def _step_handle_authentication(self, site_info: Dict[str, Any], already_authenticated: bool) -> Dict[str, Any]:
+    def _step_handle_authentication(self, nova, site_info: Dict[str, Any], already_authenticated: bool) -> Dict[str, Any]:
         """Step 3: Handle authentication process if needed."""
         self.logger.log_step(3, "Authentication Handling", "starting")
         
@@ -181,31 +195,24 @@ class AuthenticationDemo(BaseDemo):
             return {"authentication_needed": False, "authentication_result": "already_authenticated"}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                user_data_dir=self.user_data_dir,
-                clone_user_data_dir=False,
-                logs_directory="./demo/logs/auth_login"
-            ) as nova:
-                
-                if site_info.get("type") == "simple_form":
-                    # Handle simple form authentication
-                    auth_result = self._handle_form_auth(nova)
-                elif site_info.get("type") == "static":
-                    # Static site, no auth needed
-                    auth_result = {"status": "no_auth_needed", "method": "static_site"}
-                else:
-                    # Generic authentication handling
-                    auth_result = self._handle_generic_auth(nova)
-                
-                self.logger.log_step(3, "Authentication Handling", "completed", 
-                                   f"Method: {auth_result.get('method', 'unknown')}")
-                
-                return {
-                    "authentication_needed": True,
-                    "authentication_result": auth_result
-                }
-                
+            if site_info.get("type") == "simple_form":
+                # Handle simple form authentication
+                auth_result = self._handle_form_auth(nova)
+            elif site_info.get("type") == "static":
+                # Static site, no auth needed
+                auth_result = {"status": "no_auth_needed", "method": "static_site"}
+            else:
+                # Generic authentication handling
+                auth_result = self._handle_generic_auth(nova)
+            
+            self.logger.log_step(3, "Authentication Handling", "completed", 
+                               f"Method: {auth_result.get('method', 'unknown')}")
+            
+            return {
+                "authentication_needed": True,
+                "authentication_result": auth_result
+            }
+            
         except Exception as e:
             self.logger.log_step(3, "Authentication Handling", "failed", str(e))
             return {
@@ -268,36 +275,33 @@ class AuthenticationDemo(BaseDemo):
                 "error": str(e)
             }
     
-    def _step_verify_authentication(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_verify_authentication(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 4: Verify authentication status."""
         self.logger.log_step(4, "Authentication Verification", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                user_data_dir=self.user_data_dir,
-                clone_user_data_dir=False,
-                logs_directory="./demo/logs/auth_verification"
-            ) as nova:
-                
-                # Verify we can access the site
-                verification_result = {
-                    "site_accessible": True,
-                    "verification_method": "page_load",
-                    "timestamp": time.time()
-                }
-                
-                # Site-specific verification
-                if site_info.get("type") == "simple_form":
-                    # Check if form is still accessible
-                    result = nova.act("Can you see the form fields?", schema=BOOL_SCHEMA)
-                    verification_result["form_accessible"] = result.matches_schema and result.parsed_response
-                
-                self.logger.log_step(4, "Authentication Verification", "completed", "Site accessible")
-                self.logger.log_data_extraction("verification_result", verification_result, "auth_verification")
-                
-                return {"verification": verification_result}
-                
+            # Reload the site in the same browser; authentication may have
+            # navigated away from it
+            nova.go_to_url(site_info["url"])
+            
+            # Verify we can access the site
+            verification_result = {
+                "site_accessible": True,
+                "verification_method": "page_load",
+                "timestamp": time.time()
+            }
+            
+            # Site-specific verification
+            if site_info.get("type") == "simple_form":
+                # Check if form is still accessible
+                result = nova.act("Can you see the form fields?", schema=BOOL_SCHEMA)
+                verification_result["form_accessible"] = result.matches_schema and result.parsed_response
+            
+            self.logger.log_step(4, "Authentication Verification", "completed", "Site accessible")
+            self.logger.log_data_extraction("verification_result", verification_result, "auth_verification")
+            
+            return {"verification": verification_result}
+            
         except Exception as e:
             self.logger.log_step(4, "Authentication Verification", "failed", str(e))
             return {
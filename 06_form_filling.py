@@ -10,6 +10,7 @@ including adaptive field detection, validation, and error recovery.
 import os
 import sys
 import time
+from collections import defaultdict
 from typing import Dict, Any, List
 from nova_act import NovaAct, BOOL_SCHEMA
 
@@ -18,6 +19,28 @@ from demo_framework import BaseDemo, DemoResult
 from demo_framework.multi_selector import SelectorBuilder
 
 
+# Natural-language fill prompts, looked up by input type before falling back
+# to the field-name based prompts
+FIELD_PROMPTS_BY_INPUT_TYPE = {
+    "email": "fill in the email field with {value}",
+    "tel": "fill in the phone number field with {value}",
+}
+TEXTAREA_FIELD_PROMPT = "fill in the message or comment field with: {value}"
+DEFAULT_FIELD_PROMPT = "fill in the {name} field with {value}"
+
+# Reads every form control's tag and attributes inside the page in one call,
+# instead of a browser round trip per element per attribute
+FORM_CONTROLS_SCRIPT = """
+elements => elements.map(element => ({
+    tag: element.tagName.toLowerCase(),
+    type: element.getAttribute("type"),
+    name: element.getAttribute("name"),
+    placeholder: element.getAttribute("placeholder"),
+    required: element.required
+}))
+"""
+
+
 class FormFillingDemo(BaseDemo):
     """Enhanced form filling demo with adaptive field detection."""
     
@@ -54,25 +77,40 @@ class FormFillingDemo(BaseDemo):
             extracted_data.update(site_info)
             self.increment_step("Form site selection completed")
             
-            # Step 2: Analyze form structure
-            form_analysis = self._step_analyze_form(site_info["target_site"])
-            extracted_data.update(form_analysis)
-            self.increment_step("Form analysis completed")
-            
-            # Step 3: Fill form fields
-            filling_result = self._step_fill_form(site_info["target_site"], form_analysis.get("form_fields", []))
-            extracted_data.update(filling_result)
-            self.increment_step("Form filling completed")
-            
-            # Step 4: Validate form data
-            validation_result = self._step_validate_form(site_info["target_site"])
-            extracted_data.update(validation_result)
-            self.increment_step("Form validation completed")
+            # Steps 2-5 all work on the same form, so share one browser session
+            # instead of relaunching the browser and reloading the page per step
+            try:
+                with NovaAct(
+                    starting_page=site_info["target_site"]["url"],
+                    logs_directory="./demo/logs/form_filling"
+                ) as nova:
+                    
+                    # Step 2: Analyze form structure
+                    form_analysis = self._step_analyze_form(nova, site_info["target_site"])
+                    extracted_data.update(form_analysis)
+                    self.increment_step("Form analysis completed")
+                    
+                    # Step 3: Fill form fields
+                    filling_result = self._step_fill_form(nova, site_info["target_site"], form_analysis.get("form_fields", []))
+                    extracted_data.update(filling_result)
+                    self.increment_step("Form filling completed")
+                    
+                    # Step 4: Validate form data
+                    validation_result = self._step_validate_form(nova, site_info["target_site"])
+                    extracted_data.update(validation_result)
+                    self.increment_step("Form validation completed")
+                    
+                    # Step 5: Handle form submission (demo mode)
+                    submission_result = self._step_handle_submission(nova, site_info["target_site"])
+                    extracted_data.update(submission_result)
+                    self.increment_step("Form submission handling completed")
             
-            # Step 5: Handle form submission (demo mode)
-            submission_result = self._step_handle_submission(site_info["target_site"])
-            extracted_data.update(submission_result)
-            self.increment_step("Form submission handling completed")
+            except Exception as e:
+                # Record the failure like the steps themselves do, so the demo
+                # degrades step by step instead of losing what was extracted
+                self.logger.warning(f"Failed to start form filling session: {str(e)}")
+                for key in ("form_analysis", "form_filling", "form_validation", "form_submission"):
+                    extracted_data.setdefault(key, {"failed": True, "error": str(e)})
             
         except Exception as e:
             self.logger.error(f"Error during form filling: {str(e)}")
@@ -123,47 +161,42 @@ class FormFillingDemo(BaseDemo):
         
         return {"target_site": target_site}
     
-    def _step_analyze_form(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_analyze_form(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Analyze form structure and detect fields."""
         self.logger.log_step(2, "Form Analysis", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_analysis"
-            ) as nova:
-                
-                # Detect form fields using multiple strategies
-                form_fields = []
-                
-                # Strategy 1: Look for common form elements
-                common_fields = self._detect_common_fields(nova)
-                form_fields.extend(common_fields)
-                
-                # Strategy 2: Use Playwright to inspect form elements
-                playwright_fields = self._detect_playwright_fields(nova)
-                form_fields.extend(playwright_fields)
-                
-                # Strategy 3: Use Nova Act to describe the form
-                description_fields = self._detect_description_fields(nova)
-                form_fields.extend(description_fields)
-                
-                # Remove duplicates and organize
-                unique_fields = self._deduplicate_fields(form_fields)
-                
-                form_analysis = {
-                    "total_fields_detected": len(unique_fields),
-                    "form_fields": unique_fields,
-                    "detection_methods": ["common_patterns", "playwright_inspection", "ai_description"],
-                    "form_type": site_info.get("type", "unknown")
-                }
-                
-                self.logger.log_step(2, "Form Analysis", "completed", 
-                                   f"Detected {len(unique_fields)} form fields")
-                self.logger.log_data_extraction("form_analysis", form_analysis, "form_detection")
-                
-                return form_analysis
-                
+            # Detect form fields using multiple strategies
+            form_fields = []
+            
+            # Strategy 1: Look for common form elements
+            common_fields = self._detect_common_fields(nova)
+            form_fields.extend(common_fields)
+            
+            # Strategy 2: Use Playwright to inspect form elements
+            playwright_fields = self._detect_playwright_fields(nova)
+            form_fields.extend(playwright_fields)
+            
+            # Strategy 3: Use Nova Act to describe the form
+            description_fields = self._detect_description_fields(nova)
+            form_fields.extend(description_fields)
+            
+            # Remove duplicates and organize
+            unique_fields = self._deduplicate_fields(form_fields)
+            
+            form_analysis = {
+                "total_fields_detected": len(unique_fields),
+                "form_fields": unique_fields,
+                "detection_methods": ["common_patterns", "playwright_inspection", "ai_description"],
+                "form_type": site_info.get("type", "unknown")
+            }
+            
+            self.logger.log_step(2, "Form Analysis", "completed", 
+                               f"Detected {len(unique_fields)} form fields")
+            self.logger.log_data_extraction("form_analysis", form_analysis, "form_detection")
+            
+            return form_analysis
+            
         except Exception as e:
             self.logger.log_step(2, "Form Analysis", "failed", str(e))
             return {
@@ -209,53 +242,38 @@ class FormFillingDemo(BaseDemo):
         playwright_fields = []
         
         try:
-            # Find all input elements
-            inputs = nova.page.query_selector_all("input")
-            for i, input_elem in enumerate(inputs):
-                try:
-                    input_type = input_elem.get_attribute("type") or "text"
-                    input_name = input_elem.get_attribute("name") or f"input_{i}"
-                    input_placeholder = input_elem.get_attribute("placeholder") or ""
-                    
-                    playwright_fields.append({
-                        "name": input_name,
-                        "type": "playwright_input",
-                        "input_type": input_type,
-                        "placeholder": input_placeholder,
-                        "index": i
-                    })
-                except:
-                    continue
+            # Collect inputs, textareas and selects in a single pass over the
+            # page, then report them grouped by tag as before
+            controls_by_tag = defaultdict(list)
+            for control in nova.page.eval_on_selector_all("input, textarea, select", FORM_CONTROLS_SCRIPT):
+                controls_by_tag[control["tag"]].append(control)
             
-            # Find all textarea elements
-            textareas = nova.page.query_selector_all("textarea")
-            for i, textarea in enumerate(textareas):
-                try:
-                    textarea_name = textarea.get_attribute("name") or f"textarea_{i}"
-                    textarea_placeholder = textarea.get_attribute("placeholder") or ""
-                    
-                    playwright_fields.append({
-                        "name": textarea_name,
-                        "type": "playwright_textarea",
-                        "placeholder": textarea_placeholder,
-                        "index": i
-                    })
-                except:
-                    continue
+            for i, control in enumerate(controls_by_tag["input"]):
+                playwright_fields.append({
+                    "name": control["name"] or f"input_{i}",
+                    "type": "playwright_input",
+                    "input_type": control["type"] or "text",
+                    "placeholder": control["placeholder"] or "",
+                    "required": control["required"],
+                    "index": i
+                })
             
-            # Find all select elements
-            selects = nova.page.query_selector_all("select")
-            for i, select in enumerate(selects):
-                try:
-                    select_name = select.get_attribute("name") or f"select_{i}"
-                    
-                    playwright_fields.append({
-                        "name": select_name,
-                        "type": "playwright_select",
-                        "index": i
-                    })
-                except:
-                    continue
+            for i, control in enumerate(controls_by_tag["textarea"]):
+                playwright_fields.append({
+                    "name": control["name"] or f"textarea_{i}",
+                    "type": "playwright_textarea",
+                    "placeholder": control["placeholder"] or "",
+                    "required": control["required"],
+                    "index": i
+                })
+            
+            for i, control in enumerate(controls_by_tag["select"]):
+                playwright_fields.append({
+                    "name": control["name"] or f"select_{i}",
+                    "type": "playwright_select",
+                    "required": control["required"],
+                    "index": i
+                })
                     
         except Exception as e:
             self.logger.warning(f"Playwright field detection failed: {e}")
@@ -293,6 +311,7 @@ class FormFillingDemo(BaseDemo):
     def _deduplicate_fields(self, fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate fields and merge information."""
         unique_fields = {}
+        merged_methods = defaultdict(dict)  # Used as insertion-ordered sets
         
         for field in fields:
             field_name = field.get("name", "unknown")
@@ -300,20 +319,28 @@ class FormFillingDemo(BaseDemo):
             if field_name not in unique_fields:
                 unique_fields[field_name] = field
             else:
-                # Merge information from multiple detection methods
+                # Merge information from multiple detection methods; keying by
+                # method keeps repeated detections of the same kind from piling up
                 existing = unique_fields[field_name]
-                existing["detection_methods"] = existing.get("detection_methods", [])
-                existing["detection_methods"].append(field.get("type", "unknown"))
+                merged_methods[field_name][field.get("type", "unknown")] = None
                 
                 # Prefer more specific information
                 if field.get("selector") and not existing.get("selector"):
                     existing["selector"] = field["selector"]
                 if field.get("input_type") and not existing.get("input_type"):
                     existing["input_type"] = field["input_type"]
+                if field.get("required"):
+                    existing["required"] = True
+        
+        # Convert to lists so the fields stay JSON-serializable, keeping the
+        # order in which the methods detected the field
+        for field_name, methods in merged_methods.items():
+            existing = unique_fields[field_name]
+            existing["detection_methods"] = list(dict.fromkeys([*existing.get("detection_methods", []), *methods]))
         
         return list(unique_fields.values())
     
-    def _step_fill_form(self, site_info: Dict[str, Any], form_fields: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _step_fill_form(self, nova, site_info: Dict[str, Any], form_fields: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Step 3: Fill form fields with test data."""
         self.logger.log_step(3, "Form Filling", "starting")
         
@@ -322,45 +349,40 @@ class FormFillingDemo(BaseDemo):
             return {"form_filling": {"skipped": True, "reason": "no_fields"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_filling"
-            ) as nova:
-                
-                filling_results = []
-                
-                # Test data for different field types
-                test_data = {
-                    "name": "John Doe",
-                    "email": "john.doe@example.com",
-                    "phone": "555-0123",
-                    "message": "This is a test message from Nova Act demo.",
-                    "subject": "Nova Act Form Filling Demo",
-                    "company": "Demo Company Inc.",
-                    "address": "123 Demo Street, Test City, TC 12345"
-                }
-                
-                for field in form_fields:
-                    field_name = field.get("name", "unknown")
-                    field_result = self._fill_single_field(nova, field, test_data.get(field_name, f"Test {field_name}"))
-                    filling_results.append(field_result)
-                    
-                    # Brief pause between field fills
-                    time.sleep(0.5)
-                
-                successful_fills = len([r for r in filling_results if r.get("success", False)])
-                
-                self.logger.log_step(3, "Form Filling", "completed", 
-                                   f"{successful_fills}/{len(filling_results)} fields filled")
+            filling_results = []
+            
+            # Test data for different field types
+            test_data = {
+                "name": "John Doe",
+                "email": "john.doe@example.com",
+                "phone": "555-0123",
+                "message": "This is a test message from Nova Act demo.",
+                "subject": "Nova Act Form Filling Demo",
+                "company": "Demo Company Inc.",
+                "address": "123 Demo Street, Test City, TC 12345"
+            }
+            
+            for field in form_fields:
+                field_name = field.get("name", "unknown")
+                field_result = self._fill_single_field(nova, field, test_data.get(field_name, f"Test {field_name}"))
+                filling_results.append(field_result)
                 
-                return {
-                    "form_filling": {
-                        "results": filling_results,
-                        "successful_count": successful_fills,
-                        "total_fields": len(filling_results)
-                    }
+                # Brief pause between field fills
+                time.sleep(0.5)
+            
+            successful_fills = sum(1 for r in filling_results if r.get("success", False))
+            
+            self.logger.log_step(3, "Form Filling", "completed", 
+                               f"{successful_fills}/{len(filling_results)} fields filled")
+            
+            return {
+                "form_filling": {
+                    "results": filling_results,
+                    "successful_count": successful_fills,
+                    "total_fields": len(filling_results)
                 }
-                
+            }
+            
         except Exception as e:
             self.logger.log_step(3, "Form Filling", "failed", str(e))
             return {"form_filling": {"failed": True, "error": str(e)}}
@@ -368,6 +390,8 @@ class FormFillingDemo(BaseDemo):
     def _fill_single_field(self, nova, field: Dict[str, Any], value: str) -> Dict[str, Any]:
         """Fill a single form field using multiple strategies."""
         field_name = field.get("name", "unknown")
+        # Only required fields are worth a second act after a transient failure
+        max_attempts = 2 if field.get("required") else 1
         
         try:
             # Strategy 1: Use specific selector if available
@@ -387,14 +411,10 @@ class FormFillingDemo(BaseDemo):
             
             # Strategy 2: Use Nova Act natural language
             try:
-                if field.get("input_type") == "email":
-                    nova.act(f"fill in the email field with {value}")
-                elif field.get("input_type") == "tel":
-                    nova.act(f"fill in the phone number field with {value}")
-                elif field_name == "message" or field.get("type") == "playwright_textarea":
-                    nova.act(f"fill in the message or comment field with: {value}")
-                else:
-                    nova.act(f"fill in the {field_name} field with {value}")
+                # Transient page-not-ready failures are common right after
+                # navigation, so back off before burning the generic fallback
+                prompt = self._field_prompt(field, field_name, value)
+                self.error_handler.call_with_backoff(lambda: nova.act(prompt), max_attempts=max_attempts)
                 
                 return {
                     "field": field_name,
@@ -406,7 +426,10 @@ class FormFillingDemo(BaseDemo):
             except Exception as e:
                 # Strategy 3: Generic field filling
                 try:
-                    nova.act(f"find and fill any field related to {field_name} with {value}")
+                    self.error_handler.call_with_backoff(
+                        lambda: nova.act(f"find and fill any field related to {field_name} with {value}"),
+                        max_attempts=max_attempts
+                    )
                     return {
                         "field": field_name,
                         "success": True,
@@ -429,97 +452,100 @@ class FormFillingDemo(BaseDemo):
                 "error": str(e)
             }
     
-    def _step_validate_form(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _field_prompt(self, field: Dict[str, Any], field_name: str, value: str) -> str:
+        """Build the natural-language fill prompt for a field."""
+        template = FIELD_PROMPTS_BY_INPUT_TYPE.get(field.get("input_type"))
+        if template is None:
+            if field_name == "message" or field.get("type") == "playwright_textarea":
+                template = TEXTAREA_FIELD_PROMPT
+            else:
+                template = DEFAULT_FIELD_PROMPT
+        return template.format(name=field_name, value=value)
+    
+    def _step_validate_form(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 4: Validate form data after filling."""
         self.logger.log_step(4, "Form Validation", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_validation"
-            ) as nova:
-                
-                validation_results = []
-                
-                # Check if form appears to be filled
-                result = nova.act("Are the form fields filled with data?", schema=BOOL_SCHEMA)
-                form_filled = result.matches_schema and result.parsed_response
-                
-                validation_results.append({
-                    "check": "form_filled",
-                    "result": form_filled,
-                    "method": "ai_validation"
-                })
-                
-                # Check for validation errors
-                result = nova.act("Are there any validation errors or error messages visible?", schema=BOOL_SCHEMA)
-                has_errors = result.matches_schema and result.parsed_response
-                
-                validation_results.append({
-                    "check": "validation_errors",
-                    "result": not has_errors,  # Success if no errors
-                    "method": "error_detection"
-                })
-                
-                # Check if submit button is enabled
-                result = nova.act("Is the submit button enabled and clickable?", schema=BOOL_SCHEMA)
-                submit_enabled = result.matches_schema and result.parsed_response
-                
-                validation_results.append({
-                    "check": "submit_enabled",
-                    "result": submit_enabled,
-                    "method": "button_state"
-                })
-                
-                successful_validations = len([r for r in validation_results if r.get("result", False)])
-                
-                self.logger.log_step(4, "Form Validation", "completed", 
-                                   f"{successful_validations}/{len(validation_results)} validations passed")
-                
-                return {
-                    "form_validation": {
-                        "results": validation_results,
-                        "successful_count": successful_validations,
-                        "total_checks": len(validation_results)
-                    }
+            validation_results = []
+            
+            # Check if form appears to be filled
+            result = nova.act("Are the form fields filled with data?", schema=BOOL_SCHEMA)
+            form_filled = result.matches_schema and result.parsed_response
+            
+            validation_results.append({
+                "check": "form_filled",
+                "result": form_filled,
+                "method": "ai_validation"
+            })
+            
+            # Check for validation errors
+            result = nova.act("Are there any validation errors or error messages visible?", schema=BOOL_SCHEMA)
+            has_errors = result.matches_schema and result.parsed_response
+            
+            validation_results.append({
+                "check": "validation_errors",
+                "result": not has_errors,  # Success if no errors
+                "method": "error_detection"
+            })
+            
+            # Check if submit button is enabled
+            result = nova.act("Is the submit button enabled and clickable?", schema=BOOL_SCHEMA)
+            submit_enabled = result.matches_schema and result.parsed_response
+            
+            validation_results.append({
+                "check": "submit_enabled",
+                "result": submit_enabled,
+                "method": "button_state"
+            })
+            
+            successful_validations = sum(1 for r in validation_results if r.get("result", False))
+            
+            self.logger.log_step(4, "Form Validation", "completed", 
+                               f"{successful_validations}/{len(validation_results)} validations passed")
+            
+            return {
+                "form_validation": {
+                    "results": validation_results,
+                    "successful_count": successful_validations,
+                    "total_checks": len(validation_results)
                 }
-                
+            }
+            
         except Exception as e:
             self.logger.log_step(4, "Form Validation", "failed", str(e))
             return {"form_validation": {"failed": True, "error": str(e)}}
     
-    def _step_handle_submission(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_handle_submission(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 5: Handle form submission (demo mode - don't actually submit)."""
         self.logger.log_step(5, "Form Submission", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/form_submission"
-            ) as nova:
-                
-                # Look for submit button
-                result = nova.act("Can you see a submit button or send button?", schema=BOOL_SCHEMA)
-                submit_button_found = result.matches_schema and result.parsed_response
-                
-                submission_result = {
-                    "submit_button_found": submit_button_found,
-                    "actually_submitted": False,
-                    "demo_mode": True,
-                    "reason": "Demo safety - form not actually submitted"
-                }
-                
-                if submit_button_found:
-                    # For demo purposes, just identify the button but don't click it
+            # Look for submit button
+            result = nova.act("Can you see a submit button or send button?", schema=BOOL_SCHEMA)
+            submit_button_found = result.matches_schema and result.parsed_response
+            
+            submission_result = {
+                "submit_button_found": submit_button_found,
+                "actually_submitted": False,
+                "demo_mode": True,
+                "reason": "Demo safety - form not actually submitted"
+            }
+            
+            if submit_button_found:
+                # For demo purposes, just identify the button but don't click it.
+                # Locating it costs a second model call, so bulk runs can turn
+                # it off with locate_submit_button=False
+                if self.config.get("locate_submit_button", True):
                     nova.act("locate the submit button but do not click it")
-                    self.add_warning("Submit button found but not clicked for demo safety")
-                else:
-                    self.add_warning("No submit button found on the form")
-                
-                self.logger.log_step(5, "Form Submission", "completed", "Demo submission handling completed")
-                
-                return {"form_submission": submission_result}
-                
+                self.add_warning("Submit button found but not clicked for demo safety")
+            else:
+                self.add_warning("No submit button found on the form")
+            
+            self.logger.log_step(5, "Form Submission", "completed", "Demo submission handling completed")
+            
+            return {"form_submission": submission_result}
+            
         except Exception as e:
             self.logger.log_step(5, "Form Submission", "failed", str(e))
             return {"form_submission": {"failed": True, "error": str(e)}}
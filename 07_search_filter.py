@@ -9,7 +9,6 @@ including multi-criteria filtering, sorting, and result refinement.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
 from nova_act import NovaAct, BOOL_SCHEMA
 from pydantic import BaseModel
@@ -27,6 +26,21 @@ class SearchResult(BaseModel):
     availability: str = "Unknown"
 
 
+class SearchResultList(BaseModel):
+    """List of search results."""
+    results: List[SearchResult]
+
+
+class ResultCount(BaseModel):
+    """Number of search results visible on the page."""
+    count: int
+
+
+# Extraction schemas are built once at import and reused by every run
+SEARCH_RESULT_LIST_SCHEMA = SearchResultList.model_json_schema()
+RESULT_COUNT_SCHEMA = ResultCount.model_json_schema()
+
+
 class SearchFilterDemo(BaseDemo):
     """Enhanced search and filter demo with multi-criteria filtering."""
     
@@ -62,30 +76,46 @@ class SearchFilterDemo(BaseDemo):
             extracted_data.update(site_info)
             self.increment_step("Search site selection completed")
             
-            # Step 2: Perform initial search
-            search_result = self._step_perform_search(site_info["target_site"])
-            extracted_data.update(search_result)
-            self.increment_step("Initial search completed")
-            
-            # Step 3: Apply filters
-            filter_result = self._step_apply_filters(site_info["target_site"])
-            extracted_data.update(filter_result)
-            self.increment_step("Filters applied")
-            
-            # Step 4: Sort results
-            sort_result = self._step_sort_results(site_info["target_site"])
-            extracted_data.update(sort_result)
-            self.increment_step("Results sorted")
-            
-            # Step 5: Refine search
-            refinement_result = self._step_refine_search(site_info["target_site"])
-            extracted_data.update(refinement_result)
-            self.increment_step("Search refinement completed")
+            # Steps 2-6 build on each other's page state (search, then filter,
+            # sort, refine and extract), so run them in one browser session
+            # instead of relaunching and re-searching for every step
+            try:
+                with NovaAct(
+                    starting_page=site_info["target_site"]["url"],
+                    logs_directory="./demo/logs/search_filter"
+                ) as nova:
+                    
+                    # Step 2: Perform initial search
+                    search_result = self._step_perform_search(nova, site_info["target_site"])
+                    extracted_data.update(search_result)
+                    self.increment_step("Initial search completed")
+                    
+                    # Step 3: Apply filters
+                    filter_result = self._step_apply_filters(nova, site_info["target_site"])
+                    extracted_data.update(filter_result)
+                    self.increment_step("Filters applied")
+                    
+                    # Step 4: Sort results
+                    sort_result = self._step_sort_results(nova, site_info["target_site"])
+                    extracted_data.update(sort_result)
+                    self.increment_step("Results sorted")
+                    
+                    # Step 5: Refine search
+                    refinement_result = self._step_refine_search(nova, site_info["target_site"])
+                    extracted_data.update(refinement_result)
+                    self.increment_step("Search refinement completed")
+                    
+                    # Step 6: Extract final results
+                    extraction_result = self._step_extract_results(nova, site_info["target_site"])
+                    extracted_data.update(extraction_result)
+                    self.increment_step("Results extraction completed")
             
-            # Step 6: Extract final results
-            extraction_result = self._step_extract_results(site_info["target_site"])
-            extracted_data.update(extraction_result)
-            self.increment_step("Results extraction completed")
+            except Exception as e:
+                # Record the failure like the steps themselves do, so the demo
+                # degrades step by step instead of losing what was extracted
+                self.logger.warning(f"Failed to start search and filter session: {str(e)}")
+                for key in ("search_result", "filter_result", "sort_result", "refinement_result", "extraction_result"):
+                    extracted_data.setdefault(key, {"failed": True, "error": str(e)})
             
         except Exception as e:
             self.logger.error(f"Error during search and filter operations: {str(e)}")
@@ -130,51 +160,46 @@ class SearchFilterDemo(BaseDemo):
         
         return {"target_site": target_site}
     
-    def _step_perform_search(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_perform_search(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Perform initial search."""
         self.logger.log_step(2, "Initial Search", "starting")
         
         search_term = "laptop"
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_initial"
-            ) as nova:
-                
-                # Perform search
-                nova.act(f"search for {search_term}")
-                
-                # Wait for results to load
-                time.sleep(3)
-                
-                # Check if search was successful
-                result = nova.act("Are there search results visible on the page?", schema=BOOL_SCHEMA)
-                search_successful = result.matches_schema and result.parsed_response
-                
-                # Get approximate result count
-                result_count = 0
-                if search_successful:
-                    try:
-                        # Try to get result count (simplified approach)
-                        nova.act("look at the search results")
-                        result_count = "multiple"  # Simplified for demo
-                    except:
-                        result_count = "unknown"
-                
-                search_data = {
-                    "search_term": search_term,
-                    "search_successful": search_successful,
-                    "result_count": result_count,
-                    "site_type": site_info.get("type", "unknown")
-                }
-                
-                self.logger.log_step(2, "Initial Search", "completed", 
-                                   f"Search for '{search_term}' successful: {search_successful}")
-                self.logger.log_data_extraction("search_data", search_data, "initial_search")
-                
-                return {"search_result": search_data}
-                
+            # Perform search
+            nova.act(f"search for {search_term}")
+            
+            # Wait for results to load
+            self.wait_for_page(nova, 3)
+            
+            # Check if search was successful
+            result = nova.act("Are there search results visible on the page?", schema=BOOL_SCHEMA)
+            search_successful = result.matches_schema and result.parsed_response
+            
+            # Get approximate result count
+            result_count = 0
+            if search_successful:
+                try:
+                    # Try to get result count (simplified approach)
+                    nova.act("look at the search results")
+                    result_count = "multiple"  # Simplified for demo
+                except:
+                    result_count = "unknown"
+            
+            search_data = {
+                "search_term": search_term,
+                "search_successful": search_successful,
+                "result_count": result_count,
+                "site_type": site_info.get("type", "unknown")
+            }
+            
+            self.logger.log_step(2, "Initial Search", "completed", 
+                               f"Search for '{search_term}' successful: {search_successful}")
+            self.logger.log_data_extraction("search_data", search_data, "initial_search")
+            
+            return {"search_result": search_data}
+            
         except Exception as e:
             self.logger.log_step(2, "Initial Search", "failed", str(e))
             return {
@@ -185,7 +210,7 @@ class SearchFilterDemo(BaseDemo):
                 }
             }
     
-    def _step_apply_filters(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_apply_filters(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 3: Apply various filters to search results."""
         self.logger.log_step(3, "Apply Filters", "starting")
         
@@ -194,101 +219,92 @@ class SearchFilterDemo(BaseDemo):
             return {"filter_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_filters"
-            ) as nova:
-                
-                # Re-perform search to ensure we're on results page
-                nova.act("search for laptop")
-                time.sleep(2)
-                
-                applied_filters = []
-                
-                # Try to apply price filter
-                try:
-                    nova.act("look for price filters or price range options")
-                    nova.act("if there are price filters, select a reasonable price range")
-                    applied_filters.append({
-                        "type": "price",
-                        "applied": True,
-                        "method": "price_range"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "price",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                # Try to apply brand filter
-                try:
-                    nova.act("look for brand filters and select a popular brand if available")
-                    applied_filters.append({
-                        "type": "brand",
-                        "applied": True,
-                        "method": "brand_selection"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "brand",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                # Try to apply rating filter
-                try:
-                    nova.act("look for customer rating filters and select 4 stars and up if available")
-                    applied_filters.append({
-                        "type": "rating",
-                        "applied": True,
-                        "method": "rating_filter"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "rating",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                # Try to apply availability filter
-                try:
-                    nova.act("look for availability filters and select 'in stock' if available")
-                    applied_filters.append({
-                        "type": "availability",
-                        "applied": True,
-                        "method": "stock_filter"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "availability",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                successful_filters = len([f for f in applied_filters if f.get("applied", False)])
-                
-                filter_data = {
-                    "filters_applied": applied_filters,
-                    "successful_count": successful_filters,
-                    "total_attempted": len(applied_filters)
-                }
-                
-                self.logger.log_step(3, "Apply Filters", "completed", 
-                                   f"{successful_filters}/{len(applied_filters)} filters applied")
-                self.logger.log_data_extraction("filter_data", filter_data, "filter_application")
-                
-                return {"filter_result": filter_data}
-                
+            applied_filters = []
+            
+            # Try to apply price filter
+            try:
+                nova.act("look for price filters or price range options")
+                nova.act("if there are price filters, select a reasonable price range")
+                applied_filters.append({
+                    "type": "price",
+                    "applied": True,
+                    "method": "price_range"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "price",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            # Try to apply brand filter
+            try:
+                nova.act("look for brand filters and select a popular brand if available")
+                applied_filters.append({
+                    "type": "brand",
+                    "applied": True,
+                    "method": "brand_selection"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "brand",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            # Try to apply rating filter
+            try:
+                nova.act("look for customer rating filters and select 4 stars and up if available")
+                applied_filters.append({
+                    "type": "rating",
+                    "applied": True,
+                    "method": "rating_filter"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "rating",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            # Try to apply availability filter
+            try:
+                nova.act("look for availability filters and select 'in stock' if available")
+                applied_filters.append({
+                    "type": "availability",
+                    "applied": True,
+                    "method": "stock_filter"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "availability",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            successful_filters = sum(1 for f in applied_filters if f.get("applied", False))
+            
+            filter_data = {
+                "filters_applied": applied_filters,
+                "successful_count": successful_filters,
+                "total_attempted": len(applied_filters)
+            }
+            
+            self.logger.log_step(3, "Apply Filters", "completed", 
+                               f"{successful_filters}/{len(applied_filters)} filters applied")
+            self.logger.log_data_extraction("filter_data", filter_data, "filter_application")
+            
+            return {"filter_result": filter_data}
+            
         except Exception as e:
             self.logger.log_step(3, "Apply Filters", "failed", str(e))
             return {"filter_result": {"failed": True, "error": str(e)}}
     
-    def _step_sort_results(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_sort_results(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 4: Sort search results."""
         self.logger.log_step(4, "Sort Results", "starting")
         
@@ -297,196 +313,182 @@ class SearchFilterDemo(BaseDemo):
             return {"sort_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_sorting"
-            ) as nova:
-                
-                # Re-perform search to ensure we're on results page
-                nova.act("search for laptop")
-                time.sleep(2)
-                
-                sort_attempts = []
-                
-                # Try different sorting options
-                sort_options = [
-                    {"name": "price_low_high", "instruction": "sort by price from low to high"},
-                    {"name": "price_high_low", "instruction": "sort by price from high to low"},
-                    {"name": "customer_rating", "instruction": "sort by customer rating or reviews"},
-                    {"name": "newest", "instruction": "sort by newest or most recent"},
-                    {"name": "popularity", "instruction": "sort by popularity or best sellers"}
-                ]
-                
-                for sort_option in sort_options[:2]:  # Try first 2 options
-                    try:
-                        nova.act(f"look for sorting options and {sort_option['instruction']}")
-                        time.sleep(2)
-                        
-                        # Check if sorting was applied
-                        result = nova.act("Did the page refresh or change after sorting?", schema=BOOL_SCHEMA)
-                        sort_applied = result.matches_schema and result.parsed_response
-                        
-                        sort_attempts.append({
-                            "sort_type": sort_option["name"],
-                            "applied": sort_applied,
-                            "method": "natural_language"
-                        })
+            sort_attempts = []
+            
+            # Try different sorting options
+            sort_options = [
+                {"name": "price_low_high", "instruction": "sort by price from low to high"},
+                {"name": "price_high_low", "instruction": "sort by price from high to low"},
+                {"name": "customer_rating", "instruction": "sort by customer rating or reviews"},
+                {"name": "newest", "instruction": "sort by newest or most recent"},
+                {"name": "popularity", "instruction": "sort by popularity or best sellers"}
+            ]
+            
+            for sort_option in sort_options[:2]:  # Try first 2 options
+                try:
+                    nova.act(f"look for sorting options and {sort_option['instruction']}")
+                    self.wait_for_page(nova, 2, min_wait=1)
+                    
+                    # Check if sorting was applied
+                    result = nova.act("Did the page refresh or change after sorting?", schema=BOOL_SCHEMA)
+                    sort_applied = result.matches_schema and result.parsed_response
+                    
+                    sort_attempts.append({
+                        "sort_type": sort_option["name"],
+                        "applied": sort_applied,
+                        "method": "natural_language"
+                    })
+                    
+                    if sort_applied:
+                        break  # Stop after first successful sort
                         
-                        if sort_applied:
-                            break  # Stop after first successful sort
-                            
-                    except Exception as e:
-                        sort_attempts.append({
-                            "sort_type": sort_option["name"],
-                            "applied": False,
-                            "error": str(e)
-                        })
-                
-                successful_sorts = len([s for s in sort_attempts if s.get("applied", False)])
-                
-                sort_data = {
-                    "sort_attempts": sort_attempts,
-                    "successful_count": successful_sorts,
-                    "total_attempted": len(sort_attempts)
-                }
-                
-                self.logger.log_step(4, "Sort Results", "completed", 
-                                   f"{successful_sorts} sorting operations successful")
-                self.logger.log_data_extraction("sort_data", sort_data, "result_sorting")
-                
-                return {"sort_result": sort_data}
-                
+                except Exception as e:
+                    sort_attempts.append({
+                        "sort_type": sort_option["name"],
+                        "applied": False,
+                        "error": str(e)
+                    })
+            
+            successful_sorts = sum(1 for s in sort_attempts if s.get("applied", False))
+            
+            sort_data = {
+                "sort_attempts": sort_attempts,
+                "successful_count": successful_sorts,
+                "total_attempted": len(sort_attempts)
+            }
+            
+            self.logger.log_step(4, "Sort Results", "completed", 
+                               f"{successful_sorts} sorting operations successful")
+            self.logger.log_data_extraction("sort_data", sort_data, "result_sorting")
+            
+            return {"sort_result": sort_data}
+            
         except Exception as e:
             self.logger.log_step(4, "Sort Results", "failed", str(e))
             return {"sort_result": {"failed": True, "error": str(e)}}
     
-    def _step_refine_search(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_refine_search(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 5: Refine search with additional criteria."""
         self.logger.log_step(5, "Search Refinement", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_refinement"
-            ) as nova:
-                
-                # Re-perform search
-                nova.act("search for laptop")
-                time.sleep(2)
-                
-                refinement_attempts = []
-                
-                # Try to refine search with more specific terms
-                try:
-                    nova.act("refine the search by adding more specific terms like 'gaming laptop' or 'business laptop'")
-                    time.sleep(2)
-                    
-                    result = nova.act("Are the search results more specific now?", schema=BOOL_SCHEMA)
-                    refinement_successful = result.matches_schema and result.parsed_response
-                    
-                    refinement_attempts.append({
-                        "type": "term_refinement",
-                        "successful": refinement_successful,
-                        "method": "specific_terms"
-                    })
-                    
-                except Exception as e:
-                    refinement_attempts.append({
-                        "type": "term_refinement",
-                        "successful": False,
-                        "error": str(e)
-                    })
-                
-                # Try to use search suggestions
-                try:
-                    nova.act("look for search suggestions or related searches and try one")
-                    time.sleep(2)
-                    
-                    refinement_attempts.append({
-                        "type": "suggestions",
-                        "successful": True,
-                        "method": "search_suggestions"
-                    })
-                    
-                except Exception as e:
-                    refinement_attempts.append({
-                        "type": "suggestions",
-                        "successful": False,
-                        "error": str(e)
-                    })
-                
-                successful_refinements = len([r for r in refinement_attempts if r.get("successful", False)])
-                
-                refinement_data = {
-                    "refinement_attempts": refinement_attempts,
-                    "successful_count": successful_refinements,
-                    "total_attempted": len(refinement_attempts)
-                }
-                
-                self.logger.log_step(5, "Search Refinement", "completed", 
-                                   f"{successful_refinements} refinements successful")
-                self.logger.log_data_extraction("refinement_data", refinement_data, "search_refinement")
-                
-                return {"refinement_result": refinement_data}
-                
+            refinement_attempts = []
+            
+            # Try to refine search with more specific terms
+            try:
+                nova.act("refine the search by adding more specific terms like 'gaming laptop' or 'business laptop'")
+                self.wait_for_page(nova, 2, min_wait=1)
+                
+                result = nova.act("Are the search results more specific now?", schema=BOOL_SCHEMA)
+                refinement_successful = result.matches_schema and result.parsed_response
+                
+                refinement_attempts.append({
+                    "type": "term_refinement",
+                    "successful": refinement_successful,
+                    "method": "specific_terms"
+                })
+                
+            except Exception as e:
+                refinement_attempts.append({
+                    "type": "term_refinement",
+                    "successful": False,
+                    "error": str(e)
+                })
+            
+            # Try to use search suggestions
+            try:
+                nova.act("look for search suggestions or related searches and try one")
+                self.wait_for_page(nova, 2, min_wait=1)
+                
+                refinement_attempts.append({
+                    "type": "suggestions",
+                    "successful": True,
+                    "method": "search_suggestions"
+                })
+                
+            except Exception as e:
+                refinement_attempts.append({
+                    "type": "suggestions",
+                    "successful": False,
+                    "error": str(e)
+                })
+            
+            successful_refinements = sum(1 for r in refinement_attempts if r.get("successful", False))
+            
+            refinement_data = {
+                "refinement_attempts": refinement_attempts,
+                "successful_count": successful_refinements,
+                "total_attempted": len(refinement_attempts)
+            }
+            
+            self.logger.log_step(5, "Search Refinement", "completed", 
+                               f"{successful_refinements} refinements successful")
+            self.logger.log_data_extraction("refinement_data", refinement_data, "search_refinement")
+            
+            return {"refinement_result": refinement_data}
+            
         except Exception as e:
             self.logger.log_step(5, "Search Refinement", "failed", str(e))
             return {"refinement_result": {"failed": True, "error": str(e)}}
     
-    def _step_extract_results(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_extract_results(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 6: Extract final search results."""
         self.logger.log_step(6, "Results Extraction", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/search_extraction"
-            ) as nova:
-                
-                # Re-perform search to ensure we have results
-                nova.act("search for laptop")
-                time.sleep(3)
-                
-                # Extract result information
-                extraction_data = {
-                    "extraction_method": "simplified_demo",
-                    "results": []
-                }
-                
-                try:
-                    # Get basic information about search results
-                    result = nova.act("How many search results are visible on this page?")
-                    if result.response:
-                        extraction_data["result_count_description"] = result.response
-                    
-                    # Try to get information about first few results
-                    for i in range(1, 4):  # Try to get info about first 3 results
-                        try:
-                            result = nova.act(f"What is the title and price of the {i}{'st' if i==1 else 'nd' if i==2 else 'rd'} search result?")
-                            if result.response:
+            # Extract result information
+            extraction_data = {
+                "extraction_method": "simplified_demo",
+                "results": []
+            }
+            
+            try:
+                # Get basic information about search results
+                result = nova.act("How many search results are visible on this page?", schema=RESULT_COUNT_SCHEMA)
+                if result.response:
+                    extraction_data["result_count_description"] = result.response
+                
+                # The per-result questions have nothing to describe when the
+                # page shows no results after filtering and refining, so skip
+                # those round trips; an unparsed count is not taken as empty
+                results_visible = not result.matches_schema or ResultCount.model_validate(result.parsed_response).count > 0
+                if not results_visible:
+                    extraction_data["results_relevant"] = False
+                    extraction_data["skipped_reason"] = "no_search_results"
+                else:
+                    # Get the first few results in one structured act rather
+                    # than a round trip per result position
+                    try:
+                        result = nova.act(
+                            "Extract the title, price, rating and availability of the first 3 search results",
+                            schema=SEARCH_RESULT_LIST_SCHEMA
+                        )
+                        if result.matches_schema:
+                            result_list = SearchResultList.model_validate(result.parsed_response)
+                            for i, search_result in enumerate(result_list.results[:3], 1):
                                 extraction_data["results"].append({
                                     "position": i,
-                                    "description": result.response,
-                                    "extraction_method": "natural_language"
+                                    **search_result.model_dump(),
+                                    "extraction_method": "structured_schema"
                                 })
-                        except:
-                            continue
+                    except:
+                        pass
                     
                     # Check if results seem relevant
                     result = nova.act("Do the search results appear to be relevant to laptops?", schema=BOOL_SCHEMA)
                     extraction_data["results_relevant"] = result.matches_schema and result.parsed_response
-                    
-                except Exception as e:
-                    extraction_data["extraction_error"] = str(e)
-                
-                extracted_count = len(extraction_data.get("results", []))
-                
-                self.logger.log_step(6, "Results Extraction", "completed", 
-                                   f"Extracted information about {extracted_count} results")
-                self.logger.log_data_extraction("extraction_data", extraction_data, "result_extraction")
-                
-                return {"extraction_result": extraction_data}
                 
+            except Exception as e:
+                extraction_data["extraction_error"] = str(e)
+            
+            extracted_count = len(extraction_data.get("results", []))
+            
+            self.logger.log_step(6, "Results Extraction", "completed", 
+                               f"Extracted information about {extracted_count} results")
+            self.logger.log_data_extraction("extraction_data", extraction_data, "result_extraction")
+            
+            return {"extraction_result": extraction_data}
+            
         except Exception as e:
             self.logger.log_step(6, "Results Extraction", "failed", str(e))
             return {"extraction_result": {"failed": True, "error": str(e)}}
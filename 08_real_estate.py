@@ -9,7 +9,6 @@ filtering, transportation analysis, and comprehensive property data extraction.
 
 import os
 import sys
-import time
 from typing import Dict, Any, List
 from nova_act import NovaAct, BOOL_SCHEMA
 from pydantic import BaseModel
@@ -28,6 +27,32 @@ class PropertyInfo(BaseModel):
     property_type: str = "N/A"
 
 
+class PropertyList(BaseModel):
+    """List of property listings."""
+    properties: List[PropertyInfo]
+
+
+# Extraction schemas are built once at import and reused by every act
+PROPERTY_INFO_SCHEMA = PropertyInfo.model_json_schema()
+PROPERTY_LIST_SCHEMA = PropertyList.model_json_schema()
+
+
+# Search locations keyed by (region, site name), flattened once at import so a
+# lookup is a single dict probe
+SEARCH_LOCATIONS_BY_SITE = {
+    ("north_america", "zillow.com"): ["San Francisco, CA", "New York, NY", "Austin, TX"],
+    ("north_america", "realtor.com"): ["Los Angeles, CA", "Chicago, IL", "Miami, FL"],
+    ("north_america", "redfin.com"): ["Seattle, WA", "Denver, CO", "Portland, OR"],
+    ("europe", "rightmove.co.uk"): ["London", "Manchester", "Birmingham"],
+    ("europe", "immobilienscout24.de"): ["Berlin", "Munich", "Hamburg"],
+    ("europe", "seloger.com"): ["Paris", "Lyon", "Marseille"],
+    ("asia_pacific", "realestate.com.au"): ["Sydney", "Melbourne", "Brisbane"],
+    ("asia_pacific", "suumo.jp"): ["Tokyo", "Osaka", "Kyoto"],
+}
+SEARCH_LOCATION_REGIONS = frozenset(region for region, _ in SEARCH_LOCATIONS_BY_SITE)
+DEFAULT_SEARCH_LOCATIONS = ["City Center", "Downtown", "Residential Area"]
+
+
 class RealEstateDemo(BaseDemo):
     """Enhanced real estate demo with location awareness and transportation analysis."""
     
@@ -63,30 +88,45 @@ class RealEstateDemo(BaseDemo):
             extracted_data.update(site_info)
             self.increment_step("Real estate site selection completed")
             
-            # Step 2: Set search location
-            location_result = self._step_set_search_location(site_info["target_site"])
-            extracted_data.update(location_result)
-            self.increment_step("Search location set")
-            
-            # Step 3: Apply property filters
-            filter_result = self._step_apply_property_filters(site_info["target_site"])
-            extracted_data.update(filter_result)
-            self.increment_step("Property filters applied")
-            
-            # Step 4: Analyze properties
-            analysis_result = self._step_analyze_properties(site_info["target_site"])
-            extracted_data.update(analysis_result)
-            self.increment_step("Property analysis completed")
-            
-            # Step 5: Check transportation
-            transport_result = self._step_check_transportation(site_info["target_site"])
-            extracted_data.update(transport_result)
-            self.increment_step("Transportation analysis completed")
+            # Steps 2-6 all work from the same search results, so run them in
+            # one browser session instead of relaunching for every step
+            try:
+                with NovaAct(
+                    starting_page=site_info["target_site"]["url"],
+                    logs_directory="./demo/logs/real_estate"
+                ) as nova:
+                    
+                    # Step 2: Set search location
+                    location_result = self._step_set_search_location(nova, site_info["target_site"])
+                    extracted_data.update(location_result)
+                    self.increment_step("Search location set")
+                    
+                    # Step 3: Apply property filters
+                    filter_result = self._step_apply_property_filters(nova, site_info["target_site"])
+                    extracted_data.update(filter_result)
+                    self.increment_step("Property filters applied")
+                    
+                    # Step 4: Analyze properties
+                    analysis_result = self._step_analyze_properties(nova, site_info["target_site"])
+                    extracted_data.update(analysis_result)
+                    self.increment_step("Property analysis completed")
+                    
+                    # Step 5: Check transportation
+                    transport_result = self._step_check_transportation(nova, site_info["target_site"])
+                    extracted_data.update(transport_result)
+                    self.increment_step("Transportation analysis completed")
+                    
+                    # Step 6: Extract property data
+                    extraction_result = self._step_extract_property_data(nova, site_info["target_site"])
+                    extracted_data.update(extraction_result)
+                    self.increment_step("Property data extraction completed")
             
-            # Step 6: Extract property data
-            extraction_result = self._step_extract_property_data(site_info["target_site"])
-            extracted_data.update(extraction_result)
-            self.increment_step("Property data extraction completed")
+            except Exception as e:
+                # Record the failure like the steps themselves do, so the demo
+                # degrades step by step instead of losing what was extracted
+                self.logger.warning(f"Failed to start real estate session: {str(e)}")
+                for key in ("location_result", "filter_result", "analysis_result", "transport_result", "extraction_result"):
+                    extracted_data.setdefault(key, {"failed": True, "error": str(e)})
             
         except Exception as e:
             self.logger.error(f"Error during real estate operations: {str(e)}")
@@ -138,31 +178,14 @@ class RealEstateDemo(BaseDemo):
     
     def _get_search_locations(self, site_name: str, region: str) -> List[str]:
         """Get appropriate search locations based on site and region."""
-        location_mappings = {
-            "north_america": {
-                "zillow.com": ["San Francisco, CA", "New York, NY", "Austin, TX"],
-                "realtor.com": ["Los Angeles, CA", "Chicago, IL", "Miami, FL"],
-                "redfin.com": ["Seattle, WA", "Denver, CO", "Portland, OR"]
-            },
-            "europe": {
-                "rightmove.co.uk": ["London", "Manchester", "Birmingham"],
-                "immobilienscout24.de": ["Berlin", "Munich", "Hamburg"],
-                "seloger.com": ["Paris", "Lyon", "Marseille"]
-            },
-            "asia_pacific": {
-                "realestate.com.au": ["Sydney", "Melbourne", "Brisbane"],
-                "suumo.jp": ["Tokyo", "Osaka", "Kyoto"]
-            },
-            "other": ["City Center", "Downtown", "Residential Area"]
-        }
-        
-        region_locations = location_mappings.get(region, location_mappings["other"])
-        if isinstance(region_locations, dict):
-            return region_locations.get(site_name, ["City Center", "Downtown"])
-        else:
-            return region_locations
+        locations = SEARCH_LOCATIONS_BY_SITE.get((region, site_name))
+        if locations is not None:
+            return locations
+        if region in SEARCH_LOCATION_REGIONS:
+            return ["City Center", "Downtown"]
+        return DEFAULT_SEARCH_LOCATIONS
     
-    def _step_set_search_location(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_set_search_location(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 2: Set search location for property search."""
         self.logger.log_step(2, "Search Location Setup", "starting")
         
@@ -174,32 +197,27 @@ class RealEstateDemo(BaseDemo):
             return {"location_result": {"skipped": True, "reason": "fallback_site"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_location"
-            ) as nova:
-                
-                # Set search location
-                nova.act(f"search for properties in {selected_location}")
-                time.sleep(3)
-                
-                # Verify location was set
-                result = nova.act("Are property listings visible for the searched location?", schema=BOOL_SCHEMA)
-                location_set = result.matches_schema and result.parsed_response
-                
-                location_data = {
-                    "selected_location": selected_location,
-                    "available_locations": search_locations,
-                    "location_set_successfully": location_set,
-                    "site_type": site_info.get("type", "unknown")
-                }
-                
-                self.logger.log_step(2, "Search Location Setup", "completed", 
-                                   f"Location '{selected_location}' set: {location_set}")
-                self.logger.log_data_extraction("location_data", location_data, "location_setup")
-                
-                return {"location_result": location_data}
-                
+            # Set search location
+            nova.act(f"search for properties in {selected_location}")
+            self.wait_for_page(nova, 3)
+            
+            # Verify location was set
+            result = nova.act("Are property listings visible for the searched location?", schema=BOOL_SCHEMA)
+            location_set = result.matches_schema and result.parsed_response
+            
+            location_data = {
+                "selected_location": selected_location,
+                "available_locations": search_locations,
+                "location_set_successfully": location_set,
+                "site_type": site_info.get("type", "unknown")
+            }
+            
+            self.logger.log_step(2, "Search Location Setup", "completed", 
+                               f"Location '{selected_location}' set: {location_set}")
+            self.logger.log_data_extraction("location_data", location_data, "location_setup")
+            
+            return {"location_result": location_data}
+            
         except Exception as e:
             self.logger.log_step(2, "Search Location Setup", "failed", str(e))
             return {
@@ -210,7 +228,7 @@ class RealEstateDemo(BaseDemo):
                 }
             }
     
-    def _step_apply_property_filters(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_apply_property_filters(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 3: Apply property filters."""
         self.logger.log_step(3, "Property Filters", "starting")
         
@@ -219,148 +237,132 @@ class RealEstateDemo(BaseDemo):
             return {"filter_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_filters"
-            ) as nova:
-                
-                # Re-search to ensure we're on results page
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(2)
-                
-                applied_filters = []
-                
-                # Apply price filter
-                try:
-                    nova.act("look for price filters and set a reasonable price range")
-                    applied_filters.append({
-                        "type": "price_range",
-                        "applied": True,
-                        "method": "price_filter"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "price_range",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                # Apply bedroom filter
-                try:
-                    nova.act("look for bedroom filters and select 2+ bedrooms")
-                    applied_filters.append({
-                        "type": "bedrooms",
-                        "applied": True,
-                        "method": "bedroom_filter"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "bedrooms",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                # Apply property type filter
-                try:
-                    nova.act("look for property type filters and select houses or apartments")
-                    applied_filters.append({
-                        "type": "property_type",
-                        "applied": True,
-                        "method": "type_filter"
-                    })
-                    time.sleep(1)
-                except Exception as e:
-                    applied_filters.append({
-                        "type": "property_type",
-                        "applied": False,
-                        "error": str(e)
-                    })
-                
-                successful_filters = len([f for f in applied_filters if f.get("applied", False)])
-                
-                filter_data = {
-                    "filters_applied": applied_filters,
-                    "successful_count": successful_filters,
-                    "total_attempted": len(applied_filters)
-                }
-                
-                self.logger.log_step(3, "Property Filters", "completed", 
-                                   f"{successful_filters}/{len(applied_filters)} filters applied")
-                self.logger.log_data_extraction("filter_data", filter_data, "property_filtering")
-                
-                return {"filter_result": filter_data}
-                
+            applied_filters = []
+            
+            # Apply price filter
+            try:
+                nova.act("look for price filters and set a reasonable price range")
+                applied_filters.append({
+                    "type": "price_range",
+                    "applied": True,
+                    "method": "price_filter"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "price_range",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            # Apply bedroom filter
+            try:
+                nova.act("look for bedroom filters and select 2+ bedrooms")
+                applied_filters.append({
+                    "type": "bedrooms",
+                    "applied": True,
+                    "method": "bedroom_filter"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "bedrooms",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            # Apply property type filter
+            try:
+                nova.act("look for property type filters and select houses or apartments")
+                applied_filters.append({
+                    "type": "property_type",
+                    "applied": True,
+                    "method": "type_filter"
+                })
+                self.wait_for_page(nova, 2, min_wait=1)
+            except Exception as e:
+                applied_filters.append({
+                    "type": "property_type",
+                    "applied": False,
+                    "error": str(e)
+                })
+            
+            successful_filters = sum(1 for f in applied_filters if f.get("applied", False))
+            
+            filter_data = {
+                "filters_applied": applied_filters,
+                "successful_count": successful_filters,
+                "total_attempted": len(applied_filters)
+            }
+            
+            self.logger.log_step(3, "Property Filters", "completed", 
+                               f"{successful_filters}/{len(applied_filters)} filters applied")
+            self.logger.log_data_extraction("filter_data", filter_data, "property_filtering")
+            
+            return {"filter_result": filter_data}
+            
         except Exception as e:
             self.logger.log_step(3, "Property Filters", "failed", str(e))
             return {"filter_result": {"failed": True, "error": str(e)}}
     
-    def _step_analyze_properties(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_analyze_properties(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 4: Analyze available properties."""
         self.logger.log_step(4, "Property Analysis", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_analysis"
-            ) as nova:
-                
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(3)
-                
-                analysis_data = {
-                    "analysis_method": "simplified_demo",
-                    "properties_analyzed": []
-                }
-                
-                # Get general information about available properties
+            analysis_data = {
+                "analysis_method": "simplified_demo",
+                "properties_analyzed": []
+            }
+            
+            # Get general information about available properties
+            try:
+                result = nova.act("How many property listings are visible on this page?")
+                if result.response:
+                    analysis_data["property_count_description"] = result.response
+                
+                # Analyze first few properties in one structured act; the
+                # whole list is validated in a single model_validate call
                 try:
-                    result = nova.act("How many property listings are visible on this page?")
-                    if result.response:
-                        analysis_data["property_count_description"] = result.response
-                    
-                    # Analyze first few properties
-                    for i in range(1, 4):  # Analyze first 3 properties
-                        try:
-                            ordinal = "first" if i == 1 else "second" if i == 2 else "third"
-                            result = nova.act(f"What are the key details of the {ordinal} property listing (price, bedrooms, location)?")
-                            if result.response:
-                                analysis_data["properties_analyzed"].append({
-                                    "position": i,
-                                    "description": result.response,
-                                    "analysis_method": "natural_language"
-                                })
-                        except:
-                            continue
-                    
-                    # Check property availability
-                    result = nova.act("Do the properties appear to be currently available for sale or rent?", schema=BOOL_SCHEMA)
-                    analysis_data["properties_available"] = result.matches_schema and result.parsed_response
-                    
-                    # Check for property images
-                    result = nova.act("Do the property listings have photos or images?", schema=BOOL_SCHEMA)
-                    analysis_data["has_property_images"] = result.matches_schema and result.parsed_response
-                    
-                except Exception as e:
-                    analysis_data["analysis_error"] = str(e)
-                
-                analyzed_count = len(analysis_data.get("properties_analyzed", []))
-                
-                self.logger.log_step(4, "Property Analysis", "completed", 
-                                   f"Analyzed {analyzed_count} properties")
-                self.logger.log_data_extraction("analysis_data", analysis_data, "property_analysis")
-                
-                return {"analysis_result": analysis_data}
-                
+                    result = nova.act(
+                        "Extract the address, price, bedrooms and bathrooms of the first 3 property listings",
+                        schema=PROPERTY_LIST_SCHEMA
+                    )
+                    if result.matches_schema:
+                        property_list = PropertyList.model_validate(result.parsed_response)
+                        for i, property_info in enumerate(property_list.properties[:3], 1):
+                            analysis_data["properties_analyzed"].append({
+                                "position": i,
+                                **property_info.model_dump(),
+                                "analysis_method": "structured_schema"
+                            })
+                except:
+                    pass
+                
+                # Check property availability
+                result = nova.act("Do the properties appear to be currently available for sale or rent?", schema=BOOL_SCHEMA)
+                analysis_data["properties_available"] = result.matches_schema and result.parsed_response
+                
+                # Check for property images
+                result = nova.act("Do the property listings have photos or images?", schema=BOOL_SCHEMA)
+                analysis_data["has_property_images"] = result.matches_schema and result.parsed_response
+                
+            except Exception as e:
+                analysis_data["analysis_error"] = str(e)
+            
+            analyzed_count = len(analysis_data.get("properties_analyzed", []))
+            
+            self.logger.log_step(4, "Property Analysis", "completed", 
+                               f"Analyzed {analyzed_count} properties")
+            self.logger.log_data_extraction("analysis_data", analysis_data, "property_analysis")
+            
+            return {"analysis_result": analysis_data}
+            
         except Exception as e:
             self.logger.log_step(4, "Property Analysis", "failed", str(e))
             return {"analysis_result": {"failed": True, "error": str(e)}}
     
-    def _step_check_transportation(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_check_transportation(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 5: Check transportation options for properties."""
         self.logger.log_step(5, "Transportation Analysis", "starting")
         
@@ -369,156 +371,128 @@ class RealEstateDemo(BaseDemo):
             return {"transport_result": {"skipped": True, "reason": "not_supported"}}
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_transport"
-            ) as nova:
-                
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(2)
-                
-                transport_analysis = []
-                
-                # Check for transportation information
-                try:
-                    nova.act("look for transportation information, nearby transit, or commute details")
-                    
-                    # Check for public transit info
-                    result = nova.act("Is there information about public transportation or transit nearby?", schema=BOOL_SCHEMA)
-                    has_transit_info = result.matches_schema and result.parsed_response
-                    
-                    transport_analysis.append({
-                        "type": "public_transit",
-                        "information_available": has_transit_info,
-                        "method": "transit_check"
-                    })
-                    
-                    # Check for walkability information
-                    result = nova.act("Is there information about walkability or walk scores?", schema=BOOL_SCHEMA)
-                    has_walk_info = result.matches_schema and result.parsed_response
-                    
-                    transport_analysis.append({
-                        "type": "walkability",
-                        "information_available": has_walk_info,
-                        "method": "walkability_check"
-                    })
-                    
-                    # Check for nearby amenities
-                    result = nova.act("Is there information about nearby schools, shopping, or amenities?", schema=BOOL_SCHEMA)
-                    has_amenity_info = result.matches_schema and result.parsed_response
-                    
-                    transport_analysis.append({
-                        "type": "amenities",
-                        "information_available": has_amenity_info,
-                        "method": "amenity_check"
-                    })
-                    
-                except Exception as e:
-                    transport_analysis.append({
-                        "type": "general_transport",
-                        "information_available": False,
-                        "error": str(e)
-                    })
-                
-                available_info_count = len([t for t in transport_analysis if t.get("information_available", False)])
-                
-                transport_data = {
-                    "transport_analysis": transport_analysis,
-                    "available_info_count": available_info_count,
-                    "total_checks": len(transport_analysis)
-                }
-                
-                self.logger.log_step(5, "Transportation Analysis", "completed", 
-                                   f"{available_info_count}/{len(transport_analysis)} transport info types found")
-                self.logger.log_data_extraction("transport_data", transport_data, "transportation_analysis")
-                
-                return {"transport_result": transport_data}
-                
+            transport_analysis = []
+            
+            # Check for transportation information
+            try:
+                nova.act("look for transportation information, nearby transit, or commute details")
+                
+                # Check for public transit info
+                result = nova.act("Is there information about public transportation or transit nearby?", schema=BOOL_SCHEMA)
+                has_transit_info = result.matches_schema and result.parsed_response
+                
+                transport_analysis.append({
+                    "type": "public_transit",
+                    "information_available": has_transit_info,
+                    "method": "transit_check"
+                })
+                
+                # Check for walkability information
+                result = nova.act("Is there information about walkability or walk scores?", schema=BOOL_SCHEMA)
+                has_walk_info = result.matches_schema and result.parsed_response
+                
+                transport_analysis.append({
+                    "type": "walkability",
+                    "information_available": has_walk_info,
+                    "method": "walkability_check"
+                })
+                
+                # Check for nearby amenities
+                result = nova.act("Is there information about nearby schools, shopping, or amenities?", schema=BOOL_SCHEMA)
+                has_amenity_info = result.matches_schema and result.parsed_response
+                
+                transport_analysis.append({
+                    "type": "amenities",
+                    "information_available": has_amenity_info,
+                    "method": "amenity_check"
+                })
+                
+            except Exception as e:
+                transport_analysis.append({
+                    "type": "general_transport",
+                    "information_available": False,
+                    "error": str(e)
+                })
+            
+            available_info_count = sum(1 for t in transport_analysis if t.get("information_available", False))
+            
+            transport_data = {
+                "transport_analysis": transport_analysis,
+                "available_info_count": available_info_count,
+                "total_checks": len(transport_analysis)
+            }
+            
+            self.logger.log_step(5, "Transportation Analysis", "completed", 
+                               f"{available_info_count}/{len(transport_analysis)} transport info types found")
+            self.logger.log_data_extraction("transport_data", transport_data, "transportation_analysis")
+            
+            return {"transport_result": transport_data}
+            
         except Exception as e:
             self.logger.log_step(5, "Transportation Analysis", "failed", str(e))
             return {"transport_result": {"failed": True, "error": str(e)}}
     
-    def _step_extract_property_data(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _step_extract_property_data(self, nova, site_info: Dict[str, Any]) -> Dict[str, Any]:
         """Step 6: Extract detailed property data."""
         self.logger.log_step(6, "Property Data Extraction", "starting")
         
         try:
-            with NovaAct(
-                starting_page=site_info["url"],
-                logs_directory="./demo/logs/real_estate_extraction"
-            ) as nova:
-                
-                # Re-search to ensure we have results
-                search_locations = site_info.get("search_locations", ["City Center"])
-                nova.act(f"search for properties in {search_locations[0]}")
-                time.sleep(3)
+            # The transportation step may have navigated away from the result
+            # list, so bring it back before opening a listing
+            search_locations = site_info.get("search_locations", ["City Center"])
+            nova.act(f"search for properties in {search_locations[0]}")
+            self.wait_for_page(nova, 3)
+            
+            # Click on first property for detailed extraction
+            try:
+                nova.act("click on the first property listing to see more details")
+                self.wait_for_page(nova, 3)
                 
-                # Click on first property for detailed extraction
+                # Extract detailed property information in a single
+                # structured act rather than one round trip per field
                 try:
-                    nova.act("click on the first property listing to see more details")
-                    time.sleep(3)
-                    
-                    # Extract detailed property information
-                    property_details = {}
-                    
-                    # Get property address
-                    try:
-                        result = nova.act("What is the address of this property?")
-                        property_details["address"] = result.response if result.response else "Address not found"
-                    except:
-                        property_details["address"] = "Address extraction failed"
-                    
-                    # Get property price
-                    try:
-                        result = nova.act("What is the price of this property?")
-                        property_details["price"] = result.response if result.response else "Price not found"
-                    except:
-                        property_details["price"] = "Price extraction failed"
-                    
-                    # Get property specifications
-                    try:
-                        result = nova.act("How many bedrooms and bathrooms does this property have?")
-                        property_details["bed_bath"] = result.response if result.response else "Bed/bath info not found"
-                    except:
-                        property_details["bed_bath"] = "Bed/bath extraction failed"
-                    
-                    # Get property size
-                    try:
-                        result = nova.act("What is the square footage or size of this property?")
-                        property_details["size"] = result.response if result.response else "Size not found"
-                    except:
-                        property_details["size"] = "Size extraction failed"
-                    
-                    extraction_data = {
-                        "extraction_successful": True,
-                        "property_details": property_details,
-                        "extraction_method": "detailed_view"
-                    }
-                    
-                except Exception as e:
-                    # Fallback to list view extraction
-                    extraction_data = {
-                        "extraction_successful": False,
-                        "fallback_attempted": True,
-                        "error": str(e)
-                    }
-                    
-                    try:
-                        # Try to extract from list view
-                        result = nova.act("Extract basic information about the first few properties from the list view")
-                        extraction_data["list_view_data"] = result.response if result.response else "No data extracted"
-                        extraction_data["extraction_method"] = "list_view_fallback"
-                    except:
-                        extraction_data["list_view_data"] = "List view extraction also failed"
-                
-                self.logger.log_step(6, "Property Data Extraction", "completed", 
-                                   f"Extraction successful: {extraction_data.get('extraction_successful', False)}")
-                self.logger.log_data_extraction("extraction_data", extraction_data, "property_data_extraction")
+                    result = nova.act(
+                        "Extract the address, price, number of bedrooms and bathrooms, "
+                        "square footage and property type of this property",
+                        schema=PROPERTY_INFO_SCHEMA
+                    )
+                    if result.matches_schema:
+                        property_details = PropertyInfo.model_validate(result.parsed_response).model_dump()
+                    else:
+                        property_details = {
+                            "raw_response": result.response if result.response else "Property details not found"
+                        }
+                except:
+                    property_details = {"error": "Property details extraction failed"}
+                
+                extraction_data = {
+                    "extraction_successful": True,
+                    "property_details": property_details,
+                    "extraction_method": "detailed_view"
+                }
                 
-                return {"extraction_result": extraction_data}
+            except Exception as e:
+                # Fallback to list view extraction
+                extraction_data = {
+                    "extraction_successful": False,
+                    "fallback_attempted": True,
+                    "error": str(e)
+                }
                 
+                try:
+                    # Try to extract from list view
+                    result = nova.act("Extract basic information about the first few properties from the list view")
+                    extraction_data["list_view_data"] = result.response if result.response else "No data extracted"
+                    extraction_data["extraction_method"] = "list_view_fallback"
+                except:
+                    extraction_data["list_view_data"] = "List view extraction also failed"
+            
+            self.logger.log_step(6, "Property Data Extraction", "completed", 
+                               f"Extraction successful: {extraction_data.get('extraction_successful', False)}")
+            self.logger.log_data_extraction("extraction_data", extraction_data, "property_data_extraction")
+            
+            return {"extraction_result": extraction_data}
+            
         except Exception as e:
             self.logger.log_step(6, "Property Data Extraction", "failed", str(e))
             return {"extraction_result": {"failed": True, "error": str(e)}}
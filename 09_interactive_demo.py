@@ -292,7 +292,7 @@ class InteractiveDemo(BaseDemo):
                 print("   ⚠️  Page load timeout - would pause for manual check")
                 print("   👤 User could refresh or navigate manually")
             
-            successful_scenarios = len([s for s in intervention_scenarios if not s.get("intervention_needed", False)])
+            successful_scenarios = sum(1 for s in intervention_scenarios if not s.get("intervention_needed", False))
             
             intervention_data = {
                 "scenarios_tested": intervention_scenarios,
@@ -338,11 +338,13 @@ class InteractiveDemo(BaseDemo):
             print("🌐 Capturing DOM information...")
             try:
                 dom_content = self.interactive_session.page.content()
+                # Lower-case the (potentially large) page source once and reuse it
+                dom_lower = dom_content.lower()
                 state_data["dom_info"] = {
                     "content_length": len(dom_content),
-                    "has_forms": "form" in dom_content.lower(),
-                    "has_images": "img" in dom_content.lower(),
-                    "has_links": "href" in dom_content.lower()
+                    "has_forms": "form" in dom_lower,
+                    "has_images": "img" in dom_lower,
+                    "has_links": "href" in dom_lower
                 }
             except Exception as e:
                 state_data["dom_info"] = {"error": str(e)}
@@ -483,7 +485,7 @@ class InteractiveDemo(BaseDemo):
                 })
             
             debug_session["session_duration"] = time.time() - debug_start_time
-            successful_commands = len([cmd for cmd in debug_session["debug_commands"] if cmd.get("successful", False)])
+            successful_commands = sum(1 for cmd in debug_session["debug_commands"] if cmd.get("successful", False))
             debug_session["successful_commands"] = successful_commands
             debug_session["total_commands"] = len(debug_session["debug_commands"])
             
@@ -163,7 +163,7 @@ def main():
     # Final summary
     print(f"\n📊 Nova Act Demo Suite Summary:")
     print(f"   🎯 Total demos: {len(demos)}")
-    print(f"   ✅ Enhanced demos: {len([d for d in demos if d['enhanced']])}")
+    print(f"   ✅ Enhanced demos: {sum(1 for d in demos if d['enhanced'])}")
     print(f"   🌍 Geographic compatibility: Global")
     print(f"   🛡️  Error handling: Comprehensive")
     print(f"   📈 Reliability: Production-ready")
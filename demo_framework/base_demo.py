@@ -14,7 +14,7 @@ from .logger import Logger
 from .config_manager import ConfigManager
 
 
-@dataclass
+@dataclass(slots=True)
 class DemoError:
     """Represents an error that occurred during demo execution."""
     error_type: str
@@ -189,4 +189,20 @@ class BaseDemo(ABC):
         """Increment completed steps counter."""
         self.steps_completed += 1
         if description:
-            self.logger.info(f"Step {self.steps_completed}: {description}")
\ No newline at end of file
+            self.logger.info(f"Step {self.steps_completed}: {description}")
+    
+    def wait_for_page(self, nova, timeout: float = 3.0, min_wait: float = 0.0):
+        """Wait for network activity to go idle, up to timeout seconds in total.
+        
+        This returns as soon as the network is quiet, which for in-page
+        updates (filters, sorting, add to cart) can be immediately. Pass
+        min_wait to always give the DOM that long to update first.
+        """
+        try:
+            if min_wait > 0:
+                nova.page.wait_for_timeout(min_wait * 1000)
+            nova.page.wait_for_load_state("networkidle", timeout=max(timeout - min_wait, 0.1) * 1000)
+        except Exception:
+            # Pages that keep polling never reach network idle; once the timeout
+            # has passed this is no worse than the fixed sleep it replaces
+            pass
@@ -4,14 +4,37 @@ Configuration management system for Nova Act demos.
 
 import json
 import os
+import re
+import sys
+import threading
+import time
 import requests
-from dataclasses import dataclass
+from concurrent.futures import Future
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
 import platform
 from datetime import datetime
 
 
-@dataclass
+# Shared HTTP session so geolocation lookups and site probes reuse pooled
+# keep-alive connections instead of opening a new TCP/TLS connection per call
+_HTTP_SESSION = requests.Session()
+
+# Site probes currently running, keyed by URL, so concurrent callers checking
+# the same site wait on one request instead of each sending their own
+_INFLIGHT_SITE_PROBES: Dict[str, Future] = {}
+_INFLIGHT_SITE_PROBES_LOCK = threading.Lock()
+
+# Environment detection shared by every ConfigManager in the process (each demo
+# builds its own manager), refreshed after _ENVIRONMENT_TTL seconds
+_SHARED_ENVIRONMENT: Dict[str, Any] = {}
+_ENVIRONMENT_TTL = 900
+
+# Strips scheme, "www." and trailing slashes so URLs reduce to a bare domain
+_URL_DOMAIN_RE = re.compile(r"^(?:https?://)?(?:www\.)?|/+$", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
 class EnvironmentInfo:
     """Information about the user's environment."""
     country_code: str
@@ -27,7 +50,11 @@ class ConfigManager:
     
     def __init__(self):
         self.config_file = "demo/config.json"
+        self.site_access_cache_file = "demo/site_access_cache.json"
+        self.site_access_ttl = 900  # seconds a successful probe stays valid on disk
         self.environment_cache = None
+        self._site_access_cache = None
+        self._site_access_lock = threading.Lock()
         self._ensure_config_dir()
     
     def _ensure_config_dir(self):
@@ -39,6 +66,11 @@ class ConfigManager:
         if self.environment_cache:
             return self.environment_cache
         
+        shared = _SHARED_ENVIRONMENT.get("info")
+        if shared and time.time() - _SHARED_ENVIRONMENT["detected_at"] < _ENVIRONMENT_TTL:
+            self.environment_cache = shared
+            return shared
+        
         # Detect geographic location
         country_code, region = self._detect_location()
         
@@ -56,6 +88,7 @@ class ConfigManager:
             python_version=python_version,
             has_vpn=has_vpn
         )
+        _SHARED_ENVIRONMENT.update(info=self.environment_cache, detected_at=time.time())
         
         return self.environment_cache
     
@@ -71,12 +104,14 @@ class ConfigManager:
             
             for service in services:
                 try:
-                    response = requests.get(service, timeout=5)
+                    response = _HTTP_SESSION.get(service, timeout=5)
                     if response.status_code == 200:
                         data = response.json()
                         
-                        # Extract country code and region
+                        # Extract country code and region; canonicalize the code once
+                        # here since it is used as a lookup key everywhere after
                         country_code = data.get('country_code', data.get('country', 'US'))
+                        country_code = sys.intern(str(country_code).strip().upper() or 'US')
                         region = self._get_region_from_country(country_code)
                         
                         return country_code, region
@@ -172,13 +207,15 @@ class ConfigManager:
             # Update with new successful config
             all_configs[demo_name] = {
                 "config": config,
-                "environment": self.detect_environment().__dict__,
+                "environment": asdict(self.detect_environment()),
                 "timestamp": str(datetime.now())
             }
             
-            # Save back to file
-            with open(self.config_file, 'w') as f:
-                json.dump(all_configs, f, indent=2, default=str)
+            # Save back to file; the cache is machine-read, so encode it compactly
+            # in one pass and write it with a single call
+            payload = json.dumps(all_configs, separators=(",", ":"), default=str)
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                f.write(payload)
                 
         except Exception as e:
             print(f"Warning: Could not save config: {e}")
@@ -192,7 +229,7 @@ class ConfigManager:
             if demo_config:
                 # Check if environment matches
                 saved_env = demo_config.get("environment", {})
-                current_env = self.detect_environment().__dict__
+                current_env = asdict(self.detect_environment())
                 
                 # If country matches, use saved config
                 if saved_env.get("country_code") == current_env.get("country_code"):
@@ -224,16 +261,73 @@ class ConfigManager:
             "bbc.com": ["reuters.com", "theguardian.com", "cnn.com"]
         }
         
-        domain = primary_site.replace("https://", "").replace("http://", "")
+        domain = _URL_DOMAIN_RE.sub("", primary_site)
         return alternatives.get(domain, [])
     
-    def validate_site_access(self, url: str) -> bool:
-        """Check if a site is accessible from user's location."""
+    def validate_site_access(self, url: str, use_cache: bool = True) -> bool:
+        """Check if a site is accessible from user's location.
+        
+        Only successful probes are cached; pass use_cache=False to always
+        probe the site, e.g. when checking connectivity.
+        """
+        if use_cache:
+            with self._site_access_lock:
+                cached = self._load_site_access_cache().get(url)
+            if cached and cached.get("accessible") and time.time() - cached.get("checked_at", 0) < self.site_access_ttl:
+                return True
+        
+        with _INFLIGHT_SITE_PROBES_LOCK:
+            probe = _INFLIGHT_SITE_PROBES.get(url)
+            owns_probe = probe is None
+            if owns_probe:
+                probe = Future()
+                _INFLIGHT_SITE_PROBES[url] = probe
+        
+        if not owns_probe:
+            return probe.result()
+        
+        accessible = False
         try:
-            response = requests.head(url, timeout=10, allow_redirects=True)
-            return response.status_code < 400
+            response = _HTTP_SESSION.head(url, timeout=10, allow_redirects=True)
+            accessible = response.status_code < 400
         except Exception:
-            return False
+            pass
+        finally:
+            # Record the result before releasing the URL so a caller arriving
+            # afterwards finds a success in the cache rather than probing again
+            self._store_site_access(url, accessible)
+            with _INFLIGHT_SITE_PROBES_LOCK:
+                del _INFLIGHT_SITE_PROBES[url]
+            probe.set_result(accessible)
+        
+        return accessible
+    
+    def _load_site_access_cache(self) -> Dict[str, Any]:
+        """Load cached site probe results from disk (once per instance)."""
+        if self._site_access_cache is None:
+            try:
+                with open(self.site_access_cache_file, 'r', encoding='utf-8') as f:
+                    self._site_access_cache = json.load(f)
+            except Exception:
+                self._site_access_cache = {}
+        return self._site_access_cache
+    
+    def _store_site_access(self, url: str, accessible: bool):
+        """Record a site probe result so later runs can skip the request."""
+        try:
+            with self._site_access_lock:
+                cache = self._load_site_access_cache()
+                if accessible:
+                    cache[url] = {"accessible": True, "checked_at": time.time()}
+                elif cache.pop(url, None) is None:
+                    # Failures are not cached, so a transient error or an
+                    # offline run does not stick; nothing to write
+                    return
+                payload = json.dumps(cache, separators=(",", ":"))
+                with open(self.site_access_cache_file, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+        except Exception as e:
+            print(f"Warning: Could not save site access cache: {e}")
     
     def get_recommended_config(self, demo_type: str) -> Dict[str, Any]:
         """Get recommended configuration for a demo type."""
@@ -4,11 +4,39 @@ Centralized error handling and recovery system for Nova Act demos.
 
 from dataclasses import dataclass
 from typing import Optional, Callable, List, Any
+import re
 import time
 import random
 
 
-@dataclass
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """Compile a list of literal keywords into a single alternation regex."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+# Error classification patterns, compiled once at import time
+_AUTH_ERROR_RE = _keyword_pattern([
+    "authentication", "unauthorized", "api key", "invalid key",
+    "access denied", "forbidden", "401", "403"
+])
+_GEO_RESTRICTION_RE = _keyword_pattern([
+    "not available in your country", "geographic", "region",
+    "location", "blocked", "restricted", "unavailable in your area"
+])
+_ELEMENT_ERROR_RE = _keyword_pattern([
+    "element not found", "no such element", "element not visible",
+    "element not interactable", "stale element", "selector"
+])
+_TIMEOUT_ERROR_RE = _keyword_pattern([
+    "timeout", "timed out", "time limit", "took too long"
+])
+_NETWORK_ERROR_RE = _keyword_pattern([
+    "connection", "network", "dns", "unreachable", "connection refused",
+    "connection reset", "connection timeout"
+])
+
+
+@dataclass(slots=True)
 class RecoveryAction:
     """Represents a recovery action for handling errors."""
     should_retry: bool
@@ -172,41 +200,51 @@ class ErrorHandler:
         delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
         time.sleep(min(delay, 30))  # Cap at 30 seconds
     
+    def call_with_backoff(self, action: Callable[[], Any], max_attempts: int = 3,
+                          base_delay: float = 0.5) -> Any:
+        """
+        Call an action, retrying with exponential backoff and jitter on transient failure.
+        
+        Only timeout and network errors are retried; any other error is
+        re-raised at once, since repeating the action would fail the same way.
+        
+        Args:
+            action: Zero-argument callable to invoke
+            max_attempts: Total number of attempts before giving up
+            base_delay: Delay before the first retry, doubled on each attempt
+            
+        Returns:
+            The action's return value; the last exception is re-raised
+        """
+        for attempt in range(max_attempts):
+            try:
+                return action()
+            except Exception as e:
+                if attempt == max_attempts - 1 or not self.is_transient_error(e):
+                    raise
+                self.wait_with_backoff(attempt, base_delay)
+    
+    def is_transient_error(self, error: Exception) -> bool:
+        """Check if an error is a timeout or network failure worth retrying."""
+        error_message = str(error).lower()
+        return self._is_timeout_error(error_message) or self._is_network_error(error_message)
+    
     def _is_auth_error(self, error_message: str) -> bool:
         """Check if error is authentication-related."""
-        auth_keywords = [
-            "authentication", "unauthorized", "api key", "invalid key",
-            "access denied", "forbidden", "401", "403"
-        ]
-        return any(keyword in error_message for keyword in auth_keywords)
+        return _AUTH_ERROR_RE.search(error_message) is not None
     
     def _is_geo_restriction(self, error_message: str) -> bool:
         """Check if error is due to geographic restrictions."""
-        geo_keywords = [
-            "not available in your country", "geographic", "region",
-            "location", "blocked", "restricted", "unavailable in your area"
-        ]
-        return any(keyword in error_message for keyword in geo_keywords)
+        return _GEO_RESTRICTION_RE.search(error_message) is not None
     
     def _is_element_error(self, error_message: str) -> bool:
         """Check if error is element-related."""
-        element_keywords = [
-            "element not found", "no such element", "element not visible",
-            "element not interactable", "stale element", "selector"
-        ]
-        return any(keyword in error_message for keyword in element_keywords)
+        return _ELEMENT_ERROR_RE.search(error_message) is not None
     
     def _is_timeout_error(self, error_message: str) -> bool:
         """Check if error is timeout-related."""
-        timeout_keywords = [
-            "timeout", "timed out", "time limit", "took too long"
-        ]
-        return any(keyword in error_message for keyword in timeout_keywords)
+        return _TIMEOUT_ERROR_RE.search(error_message) is not None
     
     def _is_network_error(self, error_message: str) -> bool:
         """Check if error is network-related."""
-        network_keywords = [
-            "connection", "network", "dns", "unreachable", "connection refused",
-            "connection reset", "connection timeout"
-        ]
-        return any(keyword in error_message for keyword in network_keywords)
\ No newline at end of file
+        return _NETWORK_ERROR_RE.search(error_message) is not None
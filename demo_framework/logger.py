@@ -147,10 +147,19 @@ class Logger:
     
     def _log_structured_data(self, level: str, message: str, data: dict):
         """Log structured data to a separate JSON log file."""
+        # Entries below the configured level are filtered from the text log;
+        # drop them here too, before paying to serialize the payload
+        if not self.logger.isEnabledFor(getattr(logging, level)):
+            return
+        
         json_log_file = self.log_file.replace('.log', '_structured.json')
         
+        # The log_* helpers already stamp their payload; reuse that value
+        # instead of formatting a second timestamp for the same entry
+        timestamp = data.get("timestamp") or datetime.now().isoformat()
+        
         structured_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "level": level,
             "demo_name": self.demo_name,
             "message": message,
@@ -159,7 +168,9 @@ class Logger:
         
         try:
             with open(json_log_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(structured_entry) + '\n')
+                # The file is UTF-8, so write non-ASCII text as-is rather than
+                # as six-byte \uXXXX escapes per character
+                f.write(json.dumps(structured_entry, ensure_ascii=False) + '\n')
         except Exception as e:
             self.logger.error(f"Failed to write structured log: {e}")
     
@@ -167,7 +178,16 @@ class Logger:
         """Create a summary report of the demo execution."""
         summary_file = self.log_file.replace('.log', '_summary.txt')
         
-        summary_content = f"""
+        try:
+            # Serialize the extracted data before opening the file, so data that
+            # cannot be serialized fails without leaving a truncated report;
+            # the remaining sections are written straight to the file
+            extracted_json = ""
+            if demo_result.data_extracted:
+                extracted_json = json.dumps(demo_result.data_extracted, indent=2, ensure_ascii=False)
+            
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                f.write(f"""
 === DEMO EXECUTION SUMMARY ===
 Demo Name: {demo_result.demo_name}
 Status: {'SUCCESS' if demo_result.success else 'FAILED'}
@@ -175,54 +195,49 @@ Execution Time: {demo_result.execution_time:.2f} seconds
 Steps Completed: {demo_result.steps_completed}/{demo_result.steps_total}
 
 === ERRORS ({len(demo_result.errors)}) ===
-"""
-        
-        for i, error in enumerate(demo_result.errors, 1):
-            summary_content += f"""
+""")
+                
+                for i, error in enumerate(demo_result.errors, 1):
+                    f.write(f"""
 Error {i}:
   Type: {error.error_type}
   Message: {error.message}
   Recovery Attempted: {error.recovery_attempted}
   Recovery Successful: {error.recovery_successful}
   Troubleshooting Tips:
-"""
-            for tip in error.troubleshooting_tips:
-                summary_content += f"    - {tip}\n"
-        
-        summary_content += f"""
+""")
+                    for tip in error.troubleshooting_tips:
+                        f.write(f"    - {tip}\n")
+                
+                f.write(f"""
 === WARNINGS ({len(demo_result.warnings)}) ===
-"""
-        for i, warning in enumerate(demo_result.warnings, 1):
-            summary_content += f"  {i}. {warning}\n"
-        
-        if demo_result.data_extracted:
-            summary_content += f"""
-=== DATA EXTRACTED ===
-{json.dumps(demo_result.data_extracted, indent=2)}
-"""
-        
-        summary_content += f"""
+""")
+                for i, warning in enumerate(demo_result.warnings, 1):
+                    f.write(f"  {i}. {warning}\n")
+                
+                if extracted_json:
+                    f.write("\n=== DATA EXTRACTED ===\n")
+                    f.write(extracted_json)
+                    f.write("\n")
+                
+                f.write(f"""
 === LOG FILES ===
 Main Log: {self.log_file}
 Structured Log: {self.log_file.replace('.log', '_structured.json')}
 Summary: {summary_file}
 
 === RECOMMENDATIONS ===
-"""
-        
-        if not demo_result.success:
-            summary_content += "- Review the error messages above for specific issues\n"
-            summary_content += "- Check your internet connection and geographic location\n"
-            summary_content += "- Verify API keys and authentication settings\n"
-            summary_content += "- Try running individual demo steps to isolate problems\n"
-        else:
-            summary_content += "- Demo completed successfully!\n"
-            summary_content += "- Review extracted data for accuracy\n"
-            summary_content += "- Consider running additional demos to explore more features\n"
-        
-        try:
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(summary_content)
+""")
+                
+                if not demo_result.success:
+                    f.write("- Review the error messages above for specific issues\n")
+                    f.write("- Check your internet connection and geographic location\n")
+                    f.write("- Verify API keys and authentication settings\n")
+                    f.write("- Try running individual demo steps to isolate problems\n")
+                else:
+                    f.write("- Demo completed successfully!\n")
+                    f.write("- Review extracted data for accuracy\n")
+                    f.write("- Consider running additional demos to explore more features\n")
             
             self.info(f"Summary report created: {summary_file}")
             return summary_file
@@ -4,6 +4,7 @@ Multi-selector system with fallback strategies for robust element detection.
 
 from dataclasses import dataclass
 from typing import List, Optional, Any, Callable
+import logging
 import time
 import random
 from selenium.webdriver.common.by import By
@@ -12,7 +13,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
 class SelectorStrategy:
     """Represents a selector strategy with metadata."""
     name: str
@@ -48,8 +52,10 @@ class MultiSelector:
                     self.last_successful_strategy = strategy
                     return element
             except Exception as e:
-                # Log the failure but continue to next strategy
-                print(f"Strategy '{strategy.name}' failed: {str(e)}")
+                # Log the failure but continue to next strategy. Warning level
+                # keeps it visible even when no logging is configured, as the
+                # print it replaces was; the message is formatted lazily
+                logger.warning("Strategy '%s' failed: %s", strategy.name, e)
                 continue
         
         return None
@@ -286,10 +292,11 @@ class ElementWaiter:
     def wait_for_text_present(self, multi_selector: MultiSelector, expected_text: str) -> bool:
         """Wait for specific text to be present in element."""
         end_time = time.time() + self.timeout
+        expected_lower = expected_text.lower()  # Constant across polls
         
         while time.time() < end_time:
             element = multi_selector.find_element(self.driver)
-            if element and expected_text.lower() in element.text.lower():
+            if element and expected_lower in element.text.lower():
                 return True
             time.sleep(0.5)
         
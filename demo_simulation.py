@@ -161,9 +161,11 @@ def simulate_demo_suite():
     
     total_duration = time.time() - start_time
     
-    # Generate comprehensive report
-    successful_demos = [r for r in results if r.success]
-    failed_demos = [r for r in results if not r.success]
+    # Generate comprehensive report; partition the results in a single pass
+    successful_demos = []
+    failed_demos = []
+    for r in results:
+        (successful_demos if r.success else failed_demos).append(r)
     
     print(f"\n{'='*80}")
     print("COMPREHENSIVE DEMO SUITE REPORT")
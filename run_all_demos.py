@@ -10,13 +10,21 @@ providing comprehensive error handling, geographic awareness, and detailed repor
 import os
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from importlib.metadata import PackageNotFoundError, distribution
 from typing import List, Dict, Any
 import json
 
 # Import framework components
 from demo_framework import BaseDemo, DemoResult, ConfigManager, Logger
 
+# Distributions the demos import but this module does not. requests is not
+# listed: the framework import above already fails without it. selenium is
+# used by demo_framework.multi_selector (demos 01, 06 and 07)
+REQUIRED_PACKAGES = ("nova-act", "pydantic", "selenium")
+
 
 class DemoSuiteOrchestrator:
     """Orchestrates the execution of all Nova Act demos."""
@@ -38,17 +46,33 @@ class DemoSuiteOrchestrator:
             print("   export NOVA_ACT_API_KEY='your_api_key'")
             return False
         
+        # Check required packages
+        missing_packages = []
+        for package in REQUIRED_PACKAGES:
+            try:
+                distribution(package)
+            except PackageNotFoundError:
+                missing_packages.append(package)
+        
+        if missing_packages:
+            self.logger.error(f"Missing required packages: {', '.join(missing_packages)}")
+            print(f"❌ Please install: pip install {' '.join(missing_packages)}")
+            return False
+        
         # Detect environment
         env_info = self.config_manager.detect_environment()
         self.logger.info(f"Environment detected: {env_info.country_code} ({env_info.region})")
         
         # Check internet connectivity
         test_sites = ["https://google.com", "https://github.com", "https://example.com"]
-        accessible_sites = 0
         
-        for site in test_sites:
-            if self.config_manager.validate_site_access(site):
-                accessible_sites += 1
+        # Probe the test sites concurrently; each probe is a blocking request.
+        # Bypass the probe cache so this reflects the network right now
+        with ThreadPoolExecutor(max_workers=len(test_sites)) as executor:
+            accessible_sites = sum(executor.map(
+                lambda site: self.config_manager.validate_site_access(site, use_cache=False),
+                test_sites
+            ))
         
         if accessible_sites == 0:
             self.logger.error("No internet connectivity detected")
@@ -240,7 +264,8 @@ class DemoSuiteOrchestrator:
         
         # Filter selected demos if specified
         if selected_demos:
-            available_demos = [d for d in available_demos if d["file"] in selected_demos]
+            selected_files = frozenset(selected_demos)
+            available_demos = [d for d in available_demos if d["file"] in selected_files]
         
         # Sort by priority
         available_demos.sort(key=lambda x: x["priority"])
@@ -272,14 +297,24 @@ class DemoSuiteOrchestrator:
             return "No demo results available"
         
         total_duration = time.time() - self.start_time if self.start_time else 0
-        successful_demos = [r for r in self.results if r.success]
-        failed_demos = [r for r in self.results if not r.success]
+        generated_at = datetime.now()  # One timestamp for the header and the file name
+        
+        # Partition the results and tally failure types in a single pass
+        successful_demos = []
+        failed_demos = []
+        error_types = Counter()
+        for demo_result in self.results:
+            if demo_result.success:
+                successful_demos.append(demo_result)
+            else:
+                failed_demos.append(demo_result)
+                error_types.update(error.error_type for error in demo_result.errors)
         
         # Create report
         report = f"""
 Nova Act Demo Suite Comprehensive Report
 {'='*80}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated: {generated_at.strftime('%Y-%m-%d %H:%M:%S')}
 Total Execution Time: {total_duration:.2f} seconds
 
 SUMMARY
@@ -340,14 +375,9 @@ ENVIRONMENT INFORMATION
             report += "⚠️ Some demos encountered issues:\n"
             
             # Analyze common failure patterns
-            error_types = {}
-            for demo in failed_demos:
-                for error in demo.errors:
-                    error_types[error.error_type] = error_types.get(error.error_type, 0) + 1
-            
             if error_types:
                 report += "\nCommon Issues:\n"
-                for error_type, count in sorted(error_types.items(), key=lambda x: x[1], reverse=True):
+                for error_type, count in error_types.most_common():
                     report += f"• {error_type}: {count} occurrence(s)\n"
             
             # Geographic recommendations
@@ -361,7 +391,7 @@ ENVIRONMENT INFORMATION
             report += "• Try running failed demos individually for better debugging\n"
         
         # Save report to file
-        report_file = f"demo/logs/comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        report_file = f"demo/logs/comprehensive_report_{generated_at.strftime('%Y%m%d_%H%M%S')}.txt"
         try:
             with open(report_file, 'w', encoding='utf-8') as f:
                 f.write(report)